@@ -5,11 +5,18 @@ Requires an OpenAI API key (`OPENAI_API_KEY`). Install optional SDK: `pip instal
 
 from __future__ import annotations
 
+import ast
 import asyncio
+import functools
 import math
+import operator
+from typing import TYPE_CHECKING
 
 from tsunagi import Agent, OpenAIAdapter, tool
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 @tool
 async def web_search(query: str) -> str:
@@ -18,12 +25,73 @@ async def web_search(query: str) -> str:
     return f"Results for '{query}': ..."
 
 
+# Results may use at most this many bits (~3000 decimal digits).
+_MAX_POW_BITS = 10_000
+
+
+def _bounded_pow(base: float, exponent: float) -> float:
+    # Bound the size of the result, not the exponent alone: "(9 ** 999) ** 999"
+    # has a small exponent yet would tie up the worker thread for good.
+    if abs(base) > 1 and abs(exponent) * math.log2(abs(base)) > _MAX_POW_BITS:
+        raise ValueError("result too large")
+    return operator.pow(base, exponent)
+
+
+def _bounded(value: float) -> float:
+    # Every intermediate result is checked, so "*", "//" and "%" only ever see
+    # operands of at most _MAX_POW_BITS bits and each step stays cheap.
+    if isinstance(value, int) and value.bit_length() > _MAX_POW_BITS:
+        raise ValueError("result too large")
+    return value
+
+
+# Whitelist for calculator: arithmetic operators and sqrt(), nothing else.
+_BIN_OPS: dict[type[ast.operator], Callable[[float, float], float]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: _bounded_pow,
+}
+_UNARY_OPS: dict[type[ast.unaryop], Callable[[float], float]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_FUNCTIONS: dict[str, Callable[[float], float]] = {"sqrt": math.sqrt}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse(expression: str) -> ast.expr:
+    return ast.parse(expression, mode="eval").body
+
+
+def _evaluate(node: ast.expr) -> float:
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return _bounded(node.value)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        return _bounded(_BIN_OPS[type(node.op)](_evaluate(node.left), _evaluate(node.right)))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_evaluate(node.operand))
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _FUNCTIONS
+        and len(node.args) == 1
+        and not node.keywords
+    ):
+        return _FUNCTIONS[node.func.id](_evaluate(node.args[0]))
+    raise ValueError(f"unsupported expression: {ast.unparse(node)}")
+
+
 @tool
-async def calculator(expression: str) -> str:
-    """Evaluate a basic math expression."""
+def calculator(expression: str) -> str:
+    """Evaluate a basic math expression (+ - * / // % **, sqrt)."""
 
+    # Parsed and walked against a whitelist — never eval() text from an LLM.
     try:
-        return str(eval(expression, {"__builtins__": {}}, {"sqrt": math.sqrt}))
+        return str(_evaluate(_parse(expression)))
     except Exception as exc:  # pragma: no cover - example only
         return f"error: {exc}"
 
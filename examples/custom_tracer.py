@@ -5,27 +5,86 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from tsunagi import Pipeline, step
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-class JSONLTracer:
-    """Tracer implementation that appends events to a JSONL file."""
 
-    def __init__(self, path: str | Path) -> None:
+def _encode(record: dict[str, Any]) -> bytes:
+    """Encode one JSONL line. Uses orjson when installed (`pip install orjson`)."""
+
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + "\n").encode()
+
+
+class JSONLTracer:
+    """Tracer implementation that appends events to a JSONL file.
+
+    Events are buffered in memory and written with a single `writelines` call
+    once `max_buffered` events are waiting, `flush_interval` seconds after the
+    first buffered event, or when a pipeline ends — whichever comes first. The
+    time limit also covers callers that never end a pipeline, such as Agent.
+    The file handle is opened once and kept until `close()`.
+    """
+
+    def __init__(
+        self, path: str | Path, *, max_buffered: int = 256, flush_interval: float = 0.5
+    ) -> None:
         self.path = Path(path)
+        self.max_buffered = max_buffered
+        self.flush_interval = flush_interval
+        self._fh: BinaryIO | None = None
+        self._buffer: list[bytes] = []
+        self._lock = asyncio.Lock()
+        self._flush_timer: asyncio.Task[None] | None = None
 
     async def _write(self, record: dict[str, Any]) -> None:
-        await asyncio.to_thread(
-            self.path.open("a", encoding="utf-8").write, json.dumps(record) + "\n"
-        )
+        self._buffer.append(_encode(record))
+        if len(self._buffer) >= self.max_buffered:
+            await self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        # Cleared before flushing, so close() only ever cancels a sleeping timer.
+        self._flush_timer = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+            await asyncio.to_thread(self._write_lines, lines)
+
+    async def close(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        await self.flush()
+        if self._fh is not None:
+            await asyncio.to_thread(self._fh.close)
+            self._fh = None
+
+    def _write_lines(self, lines: list[bytes]) -> None:
+        if self._fh is None:
+            self._fh = self.path.open("ab")
+        self._fh.writelines(lines)
+        self._fh.flush()
 
     async def on_pipeline_start(self, ctx) -> None:  # type: ignore[no-untyped-def]
         await self._write({"event": "pipeline_start", "run_id": ctx.run_id})
 
     async def on_pipeline_end(self, ctx) -> None:  # type: ignore[no-untyped-def]
         await self._write({"event": "pipeline_end", "summary": ctx.summary()})
+        await self.flush()
 
     async def on_step_start(self, ctx, step_name, input_data):  # type: ignore[no-untyped-def]
         await self._write({"event": "step_start", "step": step_name, "input": input_data})
@@ -45,7 +104,10 @@ async def greet(name: str) -> str:
 async def main() -> None:
     tracer = JSONLTracer("./trace.jsonl")
     pipe = Pipeline("custom").use(tracer)
-    await pipe.run(greet, input="Tsunagi")
+    try:
+        await pipe.run(greet, input="Tsunagi")
+    finally:
+        await tracer.close()
 
 
 if __name__ == "__main__":
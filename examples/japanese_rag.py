@@ -2,74 +2,199 @@
 
 Demonstrates domain-specific preprocessing: PDF extraction, normalization,
 sentence chunking, and embedding. Requires optional deps when executed:
-`pip install pdfplumber fugashi openai` and relevant API keys.
+`pip install pdfplumber fugashi numpy openai` and relevant API keys.
 """
 
 from __future__ import annotations
 
 import asyncio
+import re
+import unicodedata
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias
 
-from tsunagi import Pipeline, step
+from tsunagi import Pipeline, map_batches, step
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@step
-async def extract_pdf(path: str) -> str:
-    try:
-        import pdfplumber
-    except ImportError as exc:  # pragma: no cover - example only
-        raise RuntimeError("Install pdfplumber to run this example") from exc
+    Embeddings: TypeAlias = np.ndarray | tuple[np.ndarray, np.ndarray]
 
-    text_parts: list[str] = []
+EmbeddingMode = Literal["fp32", "int8", "binary"]
+
+# Whitespace following Japanese sentence-ending punctuation.
+_SENTENCE_END = re.compile(r"(?<=[。！？])\s+")
+
+
+def _extract_pages(pdfplumber: Any, path: str) -> list[str]:
     with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            text_parts.append(page.extract_text() or "")
-    return "\n".join(text_parts)
+        return [page.extract_text() or "" for page in pdf.pages]
 
 
 @step
-async def normalize_japanese(text: str) -> str:
+async def extract_pdf(path: str) -> list[str]:
     try:
-        import unicodedata
+        import pdfplumber
     except ImportError as exc:  # pragma: no cover - example only
-        raise RuntimeError("Python stdlib missing?") from exc
+        raise RuntimeError("Install pdfplumber to run this example") from exc
 
-    normalized = unicodedata.normalize("NFKC", text)
-    return normalized.replace("\u3000", " ").strip()
+    # pdfminer is pure Python and holds the GIL, so more threads would not
+    # speed this up; one worker thread just keeps the event loop responsive.
+    # Pages stay separate; joining them would hold a second copy of the document.
+    return await asyncio.to_thread(_extract_pages, pdfplumber, path)
 
 
 @step
-async def sentence_chunks(text: str) -> list[str]:
-    try:
-        import re
-    except ImportError as exc:  # pragma: no cover - example only
-        raise RuntimeError("Python stdlib missing?") from exc
-
-    sentences = re.split(r"(?<=[。！？])\s+", text)
-    return [s for s in sentences if s]
+async def normalize_japanese(pages: list[str]) -> list[str]:
+    # NFKC already folds full-width forms, including U+3000 (ideographic space) → " ".
+    return [unicodedata.normalize("NFKC", page) for page in pages]
 
 
 @step
-async def embed_chunks(chunks: list[str]) -> list[list[float]]:
+async def sentence_chunks(pages: list[str]) -> list[str]:
+    sentences: list[str] = []
+    # Fragments of a sentence that runs across page breaks. Each page is split
+    # exactly once; only these boundary fragments are ever joined.
+    pending: list[str] = []
+    for page in pages:
+        if pending and pending[-1].endswith(("。", "！", "？")):
+            sentences.append("\n".join(pending))
+            pending = []
+        first, *rest = _SENTENCE_END.split(page)
+        pending.append(first)
+        if rest:
+            sentences.append("\n".join(pending))
+            sentences.extend(rest[:-1])
+            pending = [rest[-1]]
+    sentences.append("\n".join(pending))
+    return [s for s in map(str.strip, sentences) if s]
+
+
+EMBED_MODEL = "text-embedding-3-small"
+EMBED_DIM = 1536
+# OpenAI accepts at most 2048 inputs per embeddings request.
+EMBED_BATCH_SIZE = 2048
+EMBED_MAX_CONCURRENCY = 5
+
+
+def openai_client() -> Any:
+    # Created once in main() and bound into embed_chunks so every batch shares
+    # one HTTP connection pool. Async clients are tied to the event loop they
+    # first run on, so this is not cached at module level.
     try:
         from openai import AsyncOpenAI
     except ImportError as exc:  # pragma: no cover - example only
         raise RuntimeError("Install openai to run this example") from exc
+    return AsyncOpenAI()
+
+
+@step
+async def embed_chunks(chunks: list[str], client: Any, mode: EmbeddingMode = "fp32") -> Embeddings:
+    """Embed chunks into a contiguous (len(chunks), dim) matrix.
+
+    `mode` picks the storage format: "fp32" (float32 matrix), "int8"
+    (`quantize_int8` codes and scales) or "binary" (`quantize_binary` bits).
+    Select it in a pipeline with `embed_chunks.bind(client=..., mode="binary")`.
+    """
 
-    client = AsyncOpenAI()
-    resp = await client.embeddings.create(
-        model="text-embedding-3-small",
-        input=chunks,
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover - example only
+        raise RuntimeError("Install numpy to run this example") from exc
+
+    if chunks:
+        matrix = await _embed_matrix(chunks, client)
+    else:
+        # Skip the API but keep the (0, dim) shape the quantizers reduce over.
+        matrix = np.empty((0, EMBED_DIM), dtype=np.float32)
+
+    if mode == "int8":
+        return quantize_int8(matrix)
+    if mode == "binary":
+        return quantize_binary(matrix)
+    return matrix
+
+
+async def _embed_matrix(chunks: list[str], client: Any) -> np.ndarray:
+    import numpy as np
+
+    async def embed_batch(batch: list[str]) -> list[list[float]]:
+        resp = await client.embeddings.create(model=EMBED_MODEL, input=batch)
+        return [item.embedding for item in resp.data]
+
+    # Boilerplate (headers, footers) repeats across pages: embed each text once.
+    # Sorting by length keeps similarly sized inputs in the same request.
+    unique = sorted(dict.fromkeys(chunks), key=len)
+    vectors = await map_batches(
+        embed_batch,
+        unique,
+        batch_size=EMBED_BATCH_SIZE,
+        max_concurrency=EMBED_MAX_CONCURRENCY,
     )
-    return [item.embedding for item in resp.data]
+    matrix = np.asarray(vectors, dtype=np.float32)
+    row = {text: i for i, text in enumerate(unique)}
+    return matrix[[row[chunk] for chunk in chunks]]
+
+
+# --- Quantization ---
+# int8 cuts embedding memory and bandwidth 4x, binary 32x. Binary codes are
+# compared by Hamming distance, which makes a cheap first-pass filter before
+# rescoring the best candidates in full precision.
+
+
+def quantize_int8(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization. Returns (codes, scales), x ≈ codes * scales[:, None]."""
+
+    import numpy as np
+
+    max_abs = np.abs(x).max(axis=1)
+    scales = np.where(max_abs > 0, max_abs / 127.0, 1.0).astype(np.float32)
+    codes = np.rint(x / scales[:, None]).astype(np.int8)
+    return codes, scales
+
+
+def int8_similarity(codes: np.ndarray, scales: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Dot products of every int8 row with a float32 query vector."""
+
+    import numpy as np
+
+    q_codes, q_scales = quantize_int8(query[None, :])
+    dots = codes.astype(np.int32) @ q_codes[0].astype(np.int32)
+    return dots * scales * q_scales[0]
+
+
+def quantize_binary(x: np.ndarray) -> np.ndarray:
+    """Sign-bit quantization: one bit per dimension, packed into uint8 bytes."""
+
+    import numpy as np
+
+    return np.packbits(x > 0, axis=1)
+
+
+def hamming_distance(codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """Hamming distance between every packed row and a packed query row."""
+
+    import numpy as np
+
+    diff = np.bitwise_xor(codes, query)
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0: hardware popcount
+        return np.bitwise_count(diff).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(diff, axis=1).sum(axis=1, dtype=np.int64)
 
 
 async def main() -> None:
-    pipe = Pipeline("jp-rag")
-    vectors = await pipe.run(
-        extract_pdf >> normalize_japanese >> sentence_chunks >> embed_chunks,
-        input="./docs/source.pdf",
-    )
-    print(f"Embedded {len(vectors)} chunks")
+    client = openai_client()
+    try:
+        pipe = Pipeline("jp-rag")
+        vectors = await pipe.run(
+            extract_pdf
+            >> normalize_japanese
+            >> sentence_chunks
+            >> embed_chunks.bind(client=client),
+            input="./docs/source.pdf",
+        )
+        print(f"Embedded {len(vectors)} chunks")
+    finally:
+        await client.close()
 
 
 if __name__ == "__main__":
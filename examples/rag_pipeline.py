@@ -7,47 +7,67 @@ Install optional SDKs: `pip install openai qdrant-client anthropic`.
 from __future__ import annotations
 
 import asyncio
+from typing import Any
 
-from tsunagi import Pipeline, StdoutTracer, step
+from tsunagi import Pipeline, SemanticCache, StdoutTracer, cached, step
 
+# One client per SDK, created in main() and bound into the steps: each owns an
+# HTTP connection pool, so reusing it keeps connections alive between steps.
+# Async clients are tied to the event loop they first run on, so they are
+# created inside the running loop rather than cached at module level.
 
-@step
-async def embed(text: str) -> dict[str, object]:
+
+def openai_client() -> Any:
     try:
         from openai import AsyncOpenAI
     except ImportError as exc:  # pragma: no cover - example only
         raise RuntimeError("Install openai to run this example") from exc
-
-    client = AsyncOpenAI()
-    resp = await client.embeddings.create(model="text-embedding-3-small", input=text)
-    return {"query": text, "vector": resp.data[0].embedding}
+    return AsyncOpenAI()
 
 
-@step
-async def search(payload: dict[str, object]) -> dict[str, object]:
+def qdrant_client() -> Any:
     try:
         from qdrant_client import AsyncQdrantClient
     except ImportError as exc:  # pragma: no cover - example only
         raise RuntimeError("Install qdrant-client to run this example") from exc
-
-    client = AsyncQdrantClient()
-    hits = await client.search(
-        collection_name="documents",
-        query_vector=payload["vector"],
-        limit=3,
-    )
-    contexts = [hit.payload.get("text", "") for hit in hits]
-    return {"query": payload["query"], "contexts": contexts}
+    return AsyncQdrantClient()
 
 
-@step
-async def generate(data: dict[str, object]) -> str:
+def anthropic_client() -> Any:
     try:
         from anthropic import AsyncAnthropic
     except ImportError as exc:  # pragma: no cover - example only
         raise RuntimeError("Install anthropic to run this example") from exc
+    return AsyncAnthropic()
+
+
+# Near-duplicate queries reuse earlier search results instead of hitting Qdrant.
+search_cache = SemanticCache(threshold=0.92, max_entries=1024, ttl_seconds=3600)
 
-    client = AsyncAnthropic()
+
+@step
+@cached(max_entries=4096)
+async def embed(text: str, client: Any) -> dict[str, object]:
+    resp = await client.embeddings.create(model="text-embedding-3-small", input=text)
+    return {"query": text, "vector": resp.data[0].embedding}
+
+
+@step
+async def search(payload: dict[str, object], client: Any) -> dict[str, object]:
+    contexts = search_cache.get(payload["vector"])
+    if contexts is None:
+        hits = await client.search(
+            collection_name="documents",
+            query_vector=payload["vector"],
+            limit=3,
+        )
+        contexts = [hit.payload.get("text", "") for hit in hits]
+        search_cache.put(payload["vector"], contexts)
+    return {"query": payload["query"], "contexts": contexts}
+
+
+@step
+async def generate(data: dict[str, object], client: Any) -> str:
     prompt = "\n\n".join(data.get("contexts", []))
     message = await client.messages.create(
         model="claude-3-sonnet-20240229",
@@ -60,9 +80,18 @@ async def generate(data: dict[str, object]) -> str:
 
 
 async def main() -> None:
-    pipe = Pipeline("rag").use(StdoutTracer(verbose=True))
-    answer = await pipe.run(embed >> search >> generate, input="What is Tsunagi?")
-    print(answer)
+    openai, qdrant, anthropic = openai_client(), qdrant_client(), anthropic_client()
+    try:
+        pipe = Pipeline("rag").use(StdoutTracer(verbose=True))
+        answer = await pipe.run(
+            embed.bind(client=openai)
+            >> search.bind(client=qdrant)
+            >> generate.bind(client=anthropic),
+            input="What is Tsunagi?",
+        )
+        print(answer)
+    finally:
+        await asyncio.gather(openai.close(), qdrant.close(), anthropic.close())
 
 
 if __name__ == "__main__":
@@ -4,10 +4,13 @@ Unchained from wrappers.
 """
 
 from tsunagi.agent import Agent, AgentEvent, AnthropicAdapter, Message, OpenAIAdapter, ToolCall
+from tsunagi.batch import batched, map_batches
+from tsunagi.cache import SemanticCache, cached
 from tsunagi.context import Context, StepTiming
 from tsunagi.errors import PipelineError, StepError, TsunagiError
 from tsunagi.pipeline import Pipeline
 from tsunagi.retry import NO_RETRY, RETRY_3X, RETRY_5X, RetryConfig
+from tsunagi.runtime import install_fast_loop
 from tsunagi.step import Step, StepSequence, step
 from tsunagi.tool import Tool, tool
 from tsunagi.tracer import NullTracer, StdoutTracer, Tracer
@@ -39,4 +42,9 @@ __all__ = [
     "TsunagiError",
     "StepError",
     "PipelineError",
+    "batched",
+    "map_batches",
+    "SemanticCache",
+    "cached",
+    "install_fast_loop",
 ]
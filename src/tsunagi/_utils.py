@@ -0,0 +1,27 @@
+"""Small internal helpers shared by the step and tool decorators."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+from typing import Any
+
+
+@functools.lru_cache(maxsize=2048)
+def _cached_is_coro(fn: Any, code: Any) -> bool:
+    return inspect.iscoroutinefunction(fn)
+
+
+def is_coro(fn: Any) -> bool:
+    """inspect.iscoroutinefunction, memoized per callable.
+
+    The same function is often decorated many times (test fixtures, hot
+    reload). The key includes fn.__code__, so a reloader swapping the code in
+    place gets a fresh answer. The cache holds strong references to up to
+    2048 callables. Unhashable callables skip the cache.
+    """
+
+    try:
+        return _cached_is_coro(fn, getattr(fn, "__code__", None))
+    except TypeError:
+        return inspect.iscoroutinefunction(fn)
@@ -14,12 +14,13 @@ CRITICAL DESIGN DECISIONS:
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from tsunagi.context import Context
-from tsunagi.tracer import NullTracer, Tracer
+from tsunagi.tracer import NullTracer, Tracer, _TracerHooks
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -55,6 +56,46 @@ class AgentEvent:
     result: str = ""
 
 
+class _ApiMessages:
+    """Incremental Message → API dict conversion for a growing history.
+
+    Agent only ever appends to its message list, so each turn converts just
+    the new messages instead of rebuilding the whole payload. Already
+    converted entries are re-validated by identity against the caller's
+    messages on every call, so trimming, replacing or editing messages in
+    place (or changing the prefix) starts the conversion over rather than
+    sending a stale payload.
+    """
+
+    def __init__(self) -> None:
+        self._prefix: list[dict[str, Any]] = []
+        self._converted: list[dict[str, Any]] = []
+
+    def sync(
+        self, messages: list[Message], prefix: list[dict[str, Any]] | None = None
+    ) -> list[dict[str, Any]]:
+        prefix = prefix or []
+        converted = self._converted
+        n_prefix = len(self._prefix)
+        done = len(converted) - n_prefix
+        # Identity checks only: far cheaper than rebuilding the dicts, and a
+        # match means a fresh conversion would produce the same payload.
+        if (
+            prefix != self._prefix
+            or len(messages) < done
+            or not all(
+                c["role"] is m.role and c["content"] is m.content
+                for c, m in zip(converted[n_prefix:], messages[:done], strict=True)
+            )
+        ):
+            self._prefix = prefix
+            converted = self._converted = list(prefix)
+            done = 0
+        converted.extend({"role": m.role, "content": m.content} for m in messages[done:])
+        # A new list per call: payloads handed out earlier never change later.
+        return list(converted)
+
+
 @runtime_checkable
 class ChatAdapter(Protocol):
     """Protocol for LLM communication.
@@ -89,8 +130,11 @@ class AnthropicAdapter:
         self.max_tokens = max_tokens
         self.client_kwargs = client_kwargs
         self._client: Any = None
+        self._api_messages = _ApiMessages()
 
     def _get_client(self) -> Any:
+        # One client per adapter, created on first use and reused for every
+        # send() so its connection pool stays warm.
         if self._client is None:
             import importlib
 
@@ -105,12 +149,10 @@ class AnthropicAdapter:
     ) -> tuple[str | None, list[ToolCall]]:
         client = self._get_client()
 
-        api_messages = [{"role": m.role, "content": m.content} for m in messages]
-
         kwargs: dict[str, Any] = {
             "model": self.model,
             "max_tokens": self.max_tokens,
-            "messages": api_messages,
+            "messages": self._api_messages.sync(messages),
         }
         if self.system:
             kwargs["system"] = self.system
@@ -150,6 +192,7 @@ class OpenAIAdapter:
         self.system = system
         self.client_kwargs = client_kwargs
         self._client: Any = None
+        self._api_messages = _ApiMessages()
 
     def _get_client(self) -> Any:
         if self._client is None:
@@ -166,14 +209,11 @@ class OpenAIAdapter:
     ) -> tuple[str | None, list[ToolCall]]:
         client = self._get_client()
 
-        api_messages: list[dict[str, Any]] = []
-        if self.system:
-            api_messages.append({"role": "system", "content": self.system})
-        api_messages.extend({"role": m.role, "content": m.content} for m in messages)
-
+        # Read self.system on every send so reassigning it takes effect.
+        system = [{"role": "system", "content": self.system}] if self.system else None
         kwargs: dict[str, Any] = {
             "model": self.model,
-            "messages": api_messages,
+            "messages": self._api_messages.sync(messages, system),
         }
         if tools:
             kwargs["tools"] = [
@@ -221,22 +261,25 @@ class Agent:
         self.adapter = adapter
         self.max_turns = max_turns
         self._tools: dict[str, Tool] = {}
-        self._tracer: Tracer = tracer or NullTracer()
+        self._tool_schemas: list[dict[str, Any]] = []
+        self._tracer = _TracerHooks.bind(tracer or NullTracer())
 
     def register(self, *tools: Tool) -> None:
         """Register one or more tools for the agent to use."""
 
         for t in tools:
             self._tools[t.name] = t
+        self._tool_schemas = [t.to_schema() for t in self._tools.values()]
 
     async def chat(self, user_message: str) -> str:
         """Send a message and get a final text response.
 
         The agent loops: LLM → tool calls → LLM → ... until text response or max_turns.
+        Tool calls returned in the same turn run concurrently.
         """
 
         messages: list[Message] = [Message(role="user", content=user_message)]
-        tool_schemas = [t.to_schema() for t in self._tools.values()]
+        tool_schemas = self._tool_schemas
         ctx = Context(pipeline_name="agent")
 
         for _ in range(self.max_turns):
@@ -245,45 +288,14 @@ class Agent:
             if text is not None and not tool_calls:
                 return text
 
-            for tc in tool_calls:
-                tool_obj = self._tools.get(tc.name)
-                if tool_obj is None:
-                    result_str = json.dumps({"error": f"Unknown tool: {tc.name}"})
+            outcomes = await self._invoke_all(tool_calls, ctx)
+
+            for tc, outcome in zip(tool_calls, outcomes, strict=True):
+                if isinstance(outcome, Exception):
+                    result_str = json.dumps({"error": str(outcome)})
                 else:
-                    await self._tracer.on_step_start(ctx, tc.name, tc.arguments)
-                    try:
-                        result = await tool_obj(**tc.arguments)
-                        result_str = result if isinstance(result, str) else json.dumps(result)
-                        await self._tracer.on_step_end(ctx, tc.name, result_str)
-                    except Exception as e:  # pragma: no cover - exercised in tests
-                        result_str = json.dumps({"error": str(e)})
-                        await self._tracer.on_step_error(ctx, tc.name, e)
-
-                messages.append(
-                    Message(
-                        role="assistant",
-                        content=[
-                            {
-                                "type": "tool_use",
-                                "id": tc.id,
-                                "name": tc.name,
-                                "input": tc.arguments,
-                            }
-                        ],
-                    ),
-                )
-                messages.append(
-                    Message(
-                        role="user",
-                        content=[
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": tc.id,
-                                "content": result_str,
-                            }
-                        ],
-                    ),
-                )
+                    result_str = outcome
+                _append_tool_exchange(messages, tc, result_str)
 
         raise RuntimeError(f"Agent exceeded max_turns ({self.max_turns}) without final response")
 
@@ -291,7 +303,8 @@ class Agent:
         """Stream agent events. Yields AgentEvent objects for each action."""
 
         messages: list[Message] = [Message(role="user", content=user_message)]
-        tool_schemas = [t.to_schema() for t in self._tools.values()]
+        tool_schemas = self._tool_schemas
+        ctx = Context(pipeline_name="agent")
 
         for _ in range(self.max_turns):
             text, tool_calls = await self.adapter.send(messages, tool_schemas)
@@ -304,43 +317,86 @@ class Agent:
             for tc in tool_calls:
                 yield AgentEvent(type="tool_call", tool=tc.name, args=tc.arguments)
 
-                tool_obj = self._tools.get(tc.name)
-                if tool_obj is None:
-                    result_str = f"Unknown tool: {tc.name}"
+            outcomes = await self._invoke_all(tool_calls, ctx)
+
+            for tc, outcome in zip(tool_calls, outcomes, strict=True):
+                if isinstance(outcome, _UnknownToolError):
+                    result_str = str(outcome)
+                elif isinstance(outcome, Exception):
+                    result_str = f"Error: {outcome}"
+                    yield AgentEvent(type="error", text=str(outcome))
                 else:
-                    try:
-                        result = await tool_obj(**tc.arguments)
-                        result_str = result if isinstance(result, str) else json.dumps(result)
-                    except Exception as e:  # pragma: no cover - exercised in tests
-                        result_str = f"Error: {e}"
-                        yield AgentEvent(type="error", text=str(e))
+                    result_str = outcome
 
                 yield AgentEvent(type="tool_result", tool=tc.name, result=result_str)
-
-                messages.append(
-                    Message(
-                        role="assistant",
-                        content=[
-                            {
-                                "type": "tool_use",
-                                "id": tc.id,
-                                "name": tc.name,
-                                "input": tc.arguments,
-                            }
-                        ],
-                    ),
-                )
-                messages.append(
-                    Message(
-                        role="user",
-                        content=[
-                            {
-                                "type": "tool_result",
-                                "tool_use_id": tc.id,
-                                "content": result_str,
-                            }
-                        ],
-                    ),
-                )
+                _append_tool_exchange(messages, tc, result_str)
 
         yield AgentEvent(type="error", text=f"Exceeded max_turns ({self.max_turns})")
+
+    async def _invoke_all(self, tool_calls: list[ToolCall], ctx: Context) -> list[str | Exception]:
+        """Run all tool calls of one turn concurrently. Results keep the input order."""
+
+        outcomes = await asyncio.gather(
+            *(self._invoke(tc, ctx) for tc in tool_calls),
+            return_exceptions=True,
+        )
+        results: list[str | Exception] = []
+        for outcome in outcomes:
+            if not isinstance(outcome, str | Exception):
+                raise outcome  # e.g. KeyboardInterrupt — never report it to the LLM
+            results.append(outcome)
+        return results
+
+    async def _invoke(self, tc: ToolCall, ctx: Context) -> str:
+        """Run a single tool call with tracing and encode its result for the LLM."""
+
+        tool_obj = self._tools.get(tc.name)
+        if tool_obj is None:
+            raise _UnknownToolError(f"Unknown tool: {tc.name}")
+
+        await self._tracer.on_step_start(ctx, tc.name, tc.arguments)
+        try:
+            result = await tool_obj(**tc.arguments)
+            # Encoding is part of the tool call: an unserializable result is
+            # traced as an error, not silently dropped from the trace.
+            result_str = result if isinstance(result, str) else json.dumps(result)
+        except Exception as e:
+            await self._tracer.on_step_error(ctx, tc.name, e)
+            raise
+
+        await self._tracer.on_step_end(ctx, tc.name, result_str)
+        return result_str
+
+
+class _UnknownToolError(LookupError):
+    """The LLM requested a tool that is not registered."""
+
+
+def _append_tool_exchange(messages: list[Message], tc: ToolCall, result_str: str) -> None:
+    """Record a tool_use request and its tool_result in the conversation."""
+
+    messages.append(
+        Message(
+            role="assistant",
+            content=[
+                {
+                    "type": "tool_use",
+                    "id": tc.id,
+                    "name": tc.name,
+                    "input": tc.arguments,
+                }
+            ],
+        ),
+    )
+    messages.append(
+        Message(
+            role="user",
+            content=[
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tc.id,
+                    "content": result_str,
+                }
+            ],
+        ),
+    )
@@ -0,0 +1,89 @@
+"""Batching helpers for list-in / list-out SDK calls.
+
+Many provider endpoints (embeddings, rerankers, moderation) accept a list of
+inputs up to a provider-specific limit. These helpers split inputs into
+batches and dispatch them concurrently, preserving input order.
+
+The SDK call itself stays in user code — Tsunagi only does the slicing
+and the fan-out.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+def batched(items: Iterable[T], size: int) -> list[list[T]]:
+    """Split items into consecutive lists of at most `size` elements.
+
+    Usage:
+        batched([1, 2, 3, 4, 5], 2)  # [[1, 2], [3, 4], [5]]
+    """
+
+    if size < 1:
+        raise ValueError(f"size must be >= 1, got {size}")
+
+    seq = items if isinstance(items, list) else list(items)
+    return [seq[i : i + size] for i in range(0, len(seq), size)]
+
+
+async def map_batches(
+    fn: Callable[[list[T]], Awaitable[Sequence[U]]],
+    items: Iterable[T],
+    *,
+    batch_size: int,
+    max_concurrency: int | None = None,
+) -> list[U]:
+    """Call `fn` once per batch of items, concurrently, and flatten the results.
+
+    Usage:
+        async def embed_batch(texts: list[str]) -> list[list[float]]:
+            resp = await client.embeddings.create(model=..., input=texts)
+            return [item.embedding for item in resp.data]
+
+        vectors = await map_batches(embed_batch, chunks, batch_size=2048, max_concurrency=5)
+
+    Args:
+        fn: Async function taking a batch and returning one result per input.
+        items: Inputs to split into batches.
+        batch_size: Maximum number of inputs per call (the provider limit).
+        max_concurrency: Optional cap on in-flight calls. Default: unbounded.
+
+    Returns:
+        Results in the same order as `items`.
+
+    Raises:
+        ValueError: If `fn` returns a different number of results than inputs,
+            or if `batch_size` or `max_concurrency` is below 1.
+    """
+
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+    batches = batched(items, batch_size)
+    if not batches:
+        return []
+
+    sem = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+
+    async def _call(batch: list[T]) -> Sequence[U]:
+        if sem is None:
+            results = await fn(batch)
+        else:
+            async with sem:
+                results = await fn(batch)
+        if len(results) != len(batch):
+            raise ValueError(
+                f"Batch function returned {len(results)} results for {len(batch)} inputs"
+            )
+        return results
+
+    per_batch = await asyncio.gather(*(_call(b) for b in batches))
+    return [r for results in per_batch for r in results]
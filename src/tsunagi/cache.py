@@ -0,0 +1,243 @@
+"""In-process caches for step results.
+
+Two flavors, both opt-in and stdlib-only (numpy is used when installed):
+  - `cached`: exact-key memoization for async functions (e.g. an embed step).
+  - `SemanticCache`: lookup by embedding similarity, so near-duplicate
+    queries reuse an earlier search or answer.
+
+Both evict least-recently-used entries past `max_entries` and optionally
+expire entries after `ttl_seconds`. Caches live in the current process only.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import math
+import operator
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Sequence
+
+T = TypeVar("T")
+
+# Separates positional from keyword arguments in cached() keys, as in functools.
+_KWD_MARK = object()
+
+
+class SemanticCache:
+    """Cache keyed by vector similarity instead of exact equality.
+
+    Usage:
+        cache = SemanticCache(threshold=0.92, ttl_seconds=3600)
+
+        hit = cache.get(query_vector)
+        if hit is None:
+            hit = await expensive_search(query_vector)
+            cache.put(query_vector, hit)
+
+    Lookup is a brute-force cosine scan. If numpy is installed, unit vectors
+    live in one float32 matrix of `max_entries` rows, allocated on the first
+    put and updated in place, and are scored with a single matrix-vector
+    product; otherwise a pure-Python scan is used, which is fast enough for
+    the few thousand entries an in-process cache should hold.
+
+    Attributes:
+        threshold: Minimum cosine similarity for a hit.
+        max_entries: Capacity; least-recently-used entries are evicted beyond it.
+        ttl_seconds: Optional lifetime of an entry. Default: never expires.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._np = _numpy()
+        # key -> (value, expires_at), in LRU order
+        self._entries: OrderedDict[int, tuple[Any, float | None]] = OrderedDict()
+        self._next_key = 0
+        # Unit vectors, one row per entry. Live rows are kept packed at the front:
+        # removing an entry moves the last row into its slot. With numpy this is a
+        # preallocated max_entries x dim array, otherwise a list of tuples.
+        self._matrix: Any = None
+        self._rows: dict[int, int] = {}  # key -> row
+        self._row_keys: list[int] = []  # row -> key
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, vector: Sequence[float]) -> Any | None:
+        """Return the value stored for the most similar vector, or None on a miss."""
+
+        query = self._unit(vector)
+        if query is None:
+            return None
+
+        self._expire()
+        if not self._entries:
+            return None
+
+        best_key, best_score = self._best_match(query)
+        if best_score < self.threshold:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][0]
+
+    def put(self, vector: Sequence[float], value: Any) -> None:
+        """Store `value` under `vector`. Zero vectors are ignored.
+
+        Raises:
+            ValueError: If numpy is in use and `vector` does not match the
+                dimension of the vectors already stored.
+        """
+
+        unit = self._unit(vector)
+        if unit is None:
+            return
+
+        np = self._np
+        if np is not None:
+            if self._matrix is None:
+                self._matrix = np.empty((self.max_entries, len(unit)), dtype=np.float32)
+            elif len(unit) != self._matrix.shape[1]:
+                raise ValueError(
+                    f"expected a {self._matrix.shape[1]}-dimensional vector, got {len(unit)}"
+                )
+        elif self._matrix is None:
+            self._matrix = []
+
+        while len(self._entries) >= self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+        key = self._next_key
+        self._next_key += 1
+        row = len(self._row_keys)
+        if np is not None:
+            self._matrix[row] = unit
+        else:
+            self._matrix.append(unit)
+        self._rows[key] = row
+        self._row_keys.append(key)
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        self._entries[key] = (value, expires_at)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+
+        self._entries.clear()
+        self._rows.clear()
+        self._row_keys.clear()
+        self._matrix = None
+
+    def _remove(self, key: int) -> None:
+        del self._entries[key]
+        row = self._rows.pop(key)
+        last_key = self._row_keys.pop()
+        last_row = len(self._row_keys)
+        if row != last_row:
+            self._matrix[row] = self._matrix[last_row]
+            self._row_keys[row] = last_key
+            self._rows[last_key] = row
+        if self._np is None:
+            self._matrix.pop()
+
+    def _best_match(self, query: Any) -> tuple[int, float]:
+        if self._np is not None:
+            scores = self._matrix[: len(self._row_keys)] @ query
+            i = int(scores.argmax())
+            return self._row_keys[i], float(scores[i])
+
+        best_key, best_score = -1, -math.inf
+        for key, unit in zip(self._row_keys, self._matrix, strict=True):
+            score = sum(map(operator.mul, unit, query))
+            if score > best_score:
+                best_key, best_score = key, score
+        return best_key, best_score
+
+    def _unit(self, vector: Sequence[float]) -> Any | None:
+        np = self._np
+        if np is not None:
+            arr = np.asarray(vector, dtype=np.float32)
+            norm = float(np.linalg.norm(arr))
+            return arr / norm if norm else None
+
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm == 0:
+            return None
+        return tuple(x / norm for x in vector)
+
+    def _expire(self) -> None:
+        if self.ttl_seconds is None:
+            return
+        now = time.monotonic()
+        expired = [k for k, (_, exp) in self._entries.items() if exp is not None and exp <= now]
+        for k in expired:
+            self._remove(k)
+
+
+def _numpy() -> Any:
+    """Return the numpy module if installed, else None. numpy is never required."""
+
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+def cached(
+    *,
+    max_entries: int = 1024,
+    ttl_seconds: float | None = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Memoize an async function on its (hashable) arguments.
+
+    The async counterpart of `functools.lru_cache`, with optional expiry.
+    Apply it beneath @step so retries and tracing still see the cached call:
+
+        @step
+        @cached(max_entries=4096)
+        async def embed(text: str) -> list[float]: ...
+
+    Failed calls are not cached.
+    """
+
+    if max_entries < 1:
+        raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+
+    def decorator(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        entries: OrderedDict[Hashable, tuple[T, float | None]] = OrderedDict()
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            # _KWD_MARK keeps f(1, k=2) and f(1, ("k", 2)) from sharing a key.
+            key: Hashable = (*args, _KWD_MARK, *sorted(kwargs.items())) if kwargs else args
+            entry = entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    entries.move_to_end(key)
+                    return value
+                del entries[key]
+
+            value = await fn(*args, **kwargs)
+            expires_at = time.monotonic() + ttl_seconds if ttl_seconds is not None else None
+            entries[key] = (value, expires_at)
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
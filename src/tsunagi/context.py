@@ -2,26 +2,38 @@
 
 from __future__ import annotations
 
+import os
 import time
-import uuid
 from dataclasses import dataclass, field
 from typing import Any
 
 
 @dataclass
 class StepTiming:
-    """Timing information for a single step execution."""
+    """Timing information for a single step execution.
+
+    `started_at` / `ended_at` are `time.perf_counter_ns()` readings — only
+    their difference is meaningful. `duration_ms` is the derived wall time.
+    """
 
     step_name: str
-    started_at: float
-    ended_at: float | None = None
+    started_at: int
+    ended_at: int | None = None
     duration_ms: float | None = None
     error: Exception | None = None
 
+    def __post_init__(self) -> None:
+        # Set by Context.start_step(). A plain attribute, not a field, so that
+        # dataclasses.asdict()/repr() never walk the Context <-> StepTiming cycle.
+        self._context: Context | None = None
+
     def finish(self, error: Exception | None = None) -> None:
-        self.ended_at = time.monotonic()
-        self.duration_ms = (self.ended_at - self.started_at) * 1000
+        previous_ms = self.duration_ms or 0.0
+        self.ended_at = time.perf_counter_ns()
+        self.duration_ms = (self.ended_at - self.started_at) / 1e6
         self.error = error
+        if self._context is not None:
+            self._context._total_ms += self.duration_ms - previous_ms
 
 
 @dataclass
@@ -35,20 +47,33 @@ class Context:
         timings: Ordered list of step timing records.
     """
 
-    run_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    run_id: str = field(default_factory=lambda: os.urandom(6).hex())
     pipeline_name: str = ""
     metadata: dict[str, Any] = field(default_factory=dict)
     timings: list[StepTiming] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Running total for timings created by start_step(), and how many there are.
+        self._total_ms = 0.0
+        self._tracked = 0
+
     def start_step(self, step_name: str) -> StepTiming:
         """Record the start of a step. Returns the StepTiming for later completion."""
-        timing = StepTiming(step_name=step_name, started_at=time.monotonic())
+        timing = StepTiming(step_name=step_name, started_at=time.perf_counter_ns())
+        timing._context = self
+        self._tracked += 1
         self.timings.append(timing)
         return timing
 
     @property
     def total_duration_ms(self) -> float:
-        """Total duration of all completed steps in milliseconds."""
+        """Total duration of all completed steps in milliseconds.
+
+        Maintained incrementally as steps started via start_step() finish;
+        summed from scratch if timings were also added or removed by hand.
+        """
+        if len(self.timings) == self._tracked:
+            return self._total_ms
         return sum(t.duration_ms for t in self.timings if t.duration_ms is not None)
 
     @property
@@ -13,12 +13,16 @@ CRITICAL DESIGN DECISIONS:
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import random
+from typing import TYPE_CHECKING, Any
 
 from tsunagi.context import Context
 from tsunagi.errors import PipelineError
 from tsunagi.step import Step, StepSequence
-from tsunagi.tracer import NullTracer, Tracer
+from tsunagi.tracer import NullTracer, Tracer, _TracerHooks
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Coroutine
 
 
 class Pipeline:
@@ -37,6 +41,9 @@ class Pipeline:
     def __init__(self, name: str = "default") -> None:
         self.name = name
         self._tracer: Tracer = NullTracer()
+        self._hooks = _TracerHooks.bind(self._tracer)
+        # False while no real tracer is attached: run() then skips every tracer await.
+        self._tracing = False
         self._last_context: Context | None = None
 
     @property
@@ -49,12 +56,36 @@ class Pipeline:
         """Attach a tracer. Returns self for chaining.
 
         Args:
-            tracer: Any object implementing the Tracer protocol.
+            tracer: Any object implementing some or all of the Tracer protocol.
         """
 
         self._tracer = tracer
+        self._hooks = _TracerHooks.bind(tracer)
+        self._tracing = type(tracer) is not NullTracer
         return self
 
+    @staticmethod
+    def chain(*steps: Step | StepSequence) -> StepSequence:
+        """Build a sequence from many steps at once.
+
+        Equivalent to `a >> b >> c >> ...`, but builds a single tuple instead of
+        one intermediate sequence per `>>`. Sequences passed in are flattened.
+
+        Usage:
+            flow = Pipeline.chain(embed, search, rerank, generate)
+            result = await pipe.run(flow, input="query")
+        """
+
+        flat: list[Step] = []
+        for s in steps:
+            if isinstance(s, StepSequence):
+                flat.extend(s.steps)
+            elif isinstance(s, Step):
+                flat.append(s)
+            else:
+                raise TypeError(f"Expected Step or StepSequence, got {type(s).__name__}")
+        return StepSequence(flat)
+
     async def run(
         self,
         steps: Step | StepSequence,
@@ -76,8 +107,9 @@ class Pipeline:
             PipelineError: If any step fails (wraps the original exception).
         """
 
+        step_list: tuple[Step, ...]
         if isinstance(steps, Step):
-            step_list = [steps]
+            step_list = (steps,)
         elif isinstance(steps, StepSequence):
             step_list = steps.steps
         else:
@@ -86,27 +118,31 @@ class Pipeline:
         ctx = Context(pipeline_name=self.name, metadata=metadata or {})
         self._last_context = ctx
 
-        await self._tracer.on_pipeline_start(ctx)
+        if not self._tracing:
+            return await _run_untraced(ctx, step_list, input)
+
+        tracer = self._hooks
+        await tracer.on_pipeline_start(ctx)
 
         current = input
 
         try:
             for s in step_list:
                 timing = ctx.start_step(s.name)
-                await self._tracer.on_step_start(ctx, s.name, current)
+                await tracer.on_step_start(ctx, s.name, current)
 
                 try:
                     current = await s.execute(current)
                     timing.finish()
-                    await self._tracer.on_step_end(ctx, s.name, current)
+                    await tracer.on_step_end(ctx, s.name, current)
 
                 except Exception as e:  # pragma: no cover - tested via behavior
                     timing.finish(error=e)
-                    await self._tracer.on_step_error(ctx, s.name, e)
+                    await tracer.on_step_error(ctx, s.name, e)
                     raise PipelineError(s.name, e) from e
 
         finally:
-            await self._tracer.on_pipeline_end(ctx)
+            await tracer.on_pipeline_end(ctx)
 
         return current
 
@@ -116,6 +152,8 @@ class Pipeline:
         *,
         inputs: list[Any] | None = None,
         input: Any = None,
+        max_concurrency: int | None = None,
+        jitter: float = 0.0,
     ) -> list[Any]:
         """Execute multiple steps in parallel.
 
@@ -123,6 +161,9 @@ class Pipeline:
             steps: List of Steps to run concurrently.
             inputs: Per-step inputs (must match len(steps)). Mutually exclusive with input.
             input: Single input passed to all steps. Mutually exclusive with inputs.
+            max_concurrency: Optional cap on steps running at once. Default: unbounded.
+            jitter: Optional upper bound (seconds) of a random delay before each step
+                    starts, to spread out bursts against rate-limited APIs.
 
         Returns:
             List of results in the same order as steps.
@@ -131,6 +172,58 @@ class Pipeline:
             PipelineError: If any step fails.
         """
 
+        calls = self._parallel_calls(steps, inputs, input, max_concurrency, jitter)
+        try:
+            results = await asyncio.gather(*calls)
+        except Exception as e:  # pragma: no cover - handled in pipeline tests
+            raise PipelineError("parallel", e) from e
+        return [result for _, result in results]
+
+    async def run_parallel_as_completed(
+        self,
+        steps: list[Step],
+        *,
+        inputs: list[Any] | None = None,
+        input: Any = None,
+        max_concurrency: int | None = None,
+        jitter: float = 0.0,
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """Execute multiple steps in parallel, yielding results as they finish.
+
+        Usage:
+            async for index, result in pipe.run_parallel_as_completed(steps, inputs=items):
+                ...
+
+        Takes the same arguments as run_parallel(). Yields (index, result) pairs in
+        completion order, where index is the step's position in `steps`. Steps still
+        running when the consumer stops iterating (or a step fails) are cancelled.
+
+        Raises:
+            PipelineError: If any step fails.
+        """
+
+        calls = self._parallel_calls(steps, inputs, input, max_concurrency, jitter)
+        tasks = [asyncio.ensure_future(c) for c in calls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    yield await next_done
+                except Exception as e:
+                    raise PipelineError("parallel", e) from e
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _parallel_calls(
+        steps: list[Step],
+        inputs: list[Any] | None,
+        input: Any,
+        max_concurrency: int | None,
+        jitter: float,
+    ) -> list[Coroutine[Any, Any, tuple[int, Any]]]:
+        """Validate run_parallel arguments and build one (index, result) coroutine per step."""
+
         if inputs is not None and input is not None:
             raise ValueError("Provide either 'inputs' or 'input', not both")
 
@@ -141,8 +234,39 @@ class Pipeline:
         else:
             step_inputs = [input] * len(steps)
 
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        sem = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+
+        async def call(index: int, s: Step, inp: Any) -> tuple[int, Any]:
+            if jitter > 0:
+                await asyncio.sleep(random.uniform(0, jitter))
+            if sem is None:
+                return index, await s.execute(inp)
+            async with sem:
+                return index, await s.execute(inp)
+
+        return [
+            call(i, s, inp) for i, (s, inp) in enumerate(zip(steps, step_inputs, strict=True))
+        ]
+
+
+async def _run_untraced(ctx: Context, step_list: tuple[Step, ...], current: Any) -> Any:
+    """Pipeline.run() specialized for the no-tracer case.
+
+    Same semantics as the traced loop, minus every tracer call, with the
+    per-step lookups hoisted into locals. Kept separate so the common
+    untraced path carries no tracing branches at all.
+    """
+
+    start_step = ctx.start_step
+    for s in step_list:
+        name = s.name
+        timing = start_step(name)
         try:
-            tasks = [s.execute(inp) for s, inp in zip(steps, step_inputs, strict=True)]
-            return list(await asyncio.gather(*tasks))
-        except Exception as e:  # pragma: no cover - handled in pipeline tests
-            raise PipelineError("parallel", e) from e
+            current = await s.execute(current)
+        except Exception as e:  # pragma: no cover - tested via behavior
+            timing.finish(error=e)
+            raise PipelineError(name, e) from e
+        timing.finish()
+    return current
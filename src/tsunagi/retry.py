@@ -7,14 +7,14 @@ Retry is configured per-step, not globally. SDK exceptions propagate directly
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """Configuration for step retry behavior.
 
@@ -23,9 +23,16 @@ class RetryConfig:
         delay_seconds: Base delay between retries. Default 1.0.
         backoff_factor: Multiplier applied to delay after each retry. Default 2.0.
         jitter: If True, add random jitter to delay. Default True.
+        jitter_mode: How jitter is applied when enabled. "half" draws from
+                     [delay/2, delay], "full" from [0, delay] (AWS "full jitter",
+                     best at spreading out many clients), "none" disables it.
+                     Default "half".
         max_delay_seconds: Cap on delay between retries. Default 60.0.
         retry_on: Optional callable that receives the exception and returns True
                   if the step should be retried. Default: retry on all exceptions.
+        retry_on_types: Optional exception types to retry on, checked with a single
+                        isinstance() before retry_on. When set, other exceptions are
+                        retried only if retry_on accepts them.
     """
 
     max_attempts: int = 1
@@ -34,20 +41,62 @@ class RetryConfig:
     jitter: bool = True
     max_delay_seconds: float = 60.0
     retry_on: Callable[[Exception], bool] | None = None
+    retry_on_types: tuple[type[Exception], ...] = ()
+    jitter_mode: Literal["half", "full", "none"] = "half"
+    # Capped base delay per retry, computed once: the config is immutable.
+    _base_delays: tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.jitter_mode not in ("half", "full", "none"):
+            raise ValueError(
+                f"jitter_mode must be 'half', 'full' or 'none', got {self.jitter_mode!r}"
+            )
+        object.__setattr__(self, "_base_delays", self._build_schedule())
 
     def should_retry(self, error: Exception) -> bool:
-        if self.retry_on is None:
+        if self.retry_on_types and isinstance(error, self.retry_on_types):
             return True
-        return self.retry_on(error)
+        if self.retry_on is not None:
+            return self.retry_on(error)
+        return not self.retry_on_types
 
     def get_delay(self, attempt: int) -> float:
         """Calculate delay for the given attempt number (0-indexed)."""
-        delay = self.delay_seconds * (self.backoff_factor**attempt)
-        delay = min(delay, self.max_delay_seconds)
-        if self.jitter:
-            delay = delay * (0.5 + random.random() * 0.5)
+        if 0 <= attempt < len(self._base_delays):
+            delay = self._base_delays[attempt]
+        else:
+            delay = self._capped_delay(attempt)
+        # A zero delay stays exactly 0.0 (no random draw), which asyncio.sleep
+        # turns into a bare yield without scheduling a timer.
+        if self.jitter and delay > 0:
+            if self.jitter_mode == "half":
+                delay = delay * (0.5 + random.random() * 0.5)
+            elif self.jitter_mode == "full":
+                delay = random.uniform(0, delay)
         return delay
 
+    def _build_schedule(self) -> tuple[float, ...]:
+        # One delay between each pair of attempts.
+        n = max(self.max_attempts - 1, 0)
+        cap = self.max_delay_seconds
+        grows = self.backoff_factor >= 1 and self.delay_seconds >= 0
+        delays: list[float] = []
+        for i in range(n):
+            delay = self._capped_delay(i)
+            delays.append(delay)
+            if grows and delay >= cap:
+                # Non-decreasing from here on, so the rest of the schedule is the cap.
+                delays.extend([cap] * (n - i - 1))
+                break
+        return tuple(delays)
+
+    def _capped_delay(self, attempt: int) -> float:
+        try:
+            delay = self.delay_seconds * (self.backoff_factor**attempt)
+        except OverflowError:
+            return self.max_delay_seconds
+        return min(delay, self.max_delay_seconds)
+
 
 # Predefined retry configs for convenience
 NO_RETRY = RetryConfig(max_attempts=1)
@@ -0,0 +1,37 @@
+"""Optional event-loop acceleration.
+
+Tsunagi workloads are dominated by I/O (LLM and API calls, tracer writes),
+so a faster event loop speeds them up directly. uvloop (Unix) and winloop
+(Windows) are not dependencies — install one to opt in:
+
+    pip install uvloop
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import sys
+
+
+def install_fast_loop() -> bool:
+    """Use uvloop (winloop on Windows) for new event loops, if installed.
+
+    Call once before asyncio.run(); loops that are already running are unaffected.
+
+    Usage:
+        install_fast_loop()
+        asyncio.run(main())
+
+    Returns:
+        True if a fast loop policy was installed, False if the stdlib loop is kept.
+    """
+
+    module_name = "winloop" if sys.platform == "win32" else "uvloop"
+    try:
+        loop_module = importlib.import_module(module_name)
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(loop_module.EventLoopPolicy())
+    return True
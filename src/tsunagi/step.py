@@ -14,19 +14,83 @@ from __future__ import annotations
 
 import asyncio
 import functools
-import inspect
+import math
+import os
+import warnings
 from typing import TYPE_CHECKING, Any, TypeVar, overload
 
+from tsunagi._utils import is_coro
 from tsunagi.errors import StepError
 from tsunagi.errors import TimeoutError as TsunagiTimeoutError
 from tsunagi.retry import NO_RETRY, RetryConfig
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable
 
 T = TypeVar("T")
 
 
+def _min_sleep_seconds(default: float = 0.001) -> float:
+    """Read TSUNAGI_MIN_SLEEP_SECONDS, falling back to `default` if it is not a number >= 0."""
+
+    raw = os.environ.get("TSUNAGI_MIN_SLEEP_SECONDS")
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = math.nan
+    if not value >= 0:  # also rejects NaN
+        warnings.warn(
+            f"Ignoring invalid TSUNAGI_MIN_SLEEP_SECONDS={raw!r}; using {default}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return default
+    return value
+
+
+# Retry delays below this are treated as a plain yield (asyncio.sleep(0)):
+# event-loop timers are only about millisecond-accurate, so a shorter sleep
+# would still cost a timer handle without meaningfully waiting.
+# Override with TSUNAGI_MIN_SLEEP_SECONDS (e.g. 0 to always use real timers).
+_MIN_SLEEP_SECONDS = _min_sleep_seconds()
+
+
+class _FunctionDoc:
+    """`__doc__` for slotted wrappers: the class docstring on the class, fn's on instances.
+
+    A `__doc__` slot would clash with the class docstring, so instances expose
+    the wrapped function's docstring through this descriptor instead.
+    """
+
+    __slots__ = ("class_doc",)
+
+    def __init__(self, class_doc: str | None) -> None:
+        self.class_doc = class_doc
+
+    def __get__(self, instance: Step | None, owner: type | None = None) -> str | None:
+        if instance is None:
+            return self.class_doc
+        return instance.fn.__doc__
+
+
+class _FunctionModule(str):
+    """`__module__` for slotted wrappers: the defining module on the class, fn's on instances.
+
+    type() reads `__module__` straight from the class dict without invoking
+    descriptors, so this is a str (keeping class repr and pickling intact)
+    that also acts as a descriptor for instance lookups.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, instance: Step | None, owner: type | None = None) -> str:
+        if instance is None:
+            return str(self)
+        return instance.fn.__module__
+
+
 class Step:
     """A composable async function with metadata for pipeline execution.
 
@@ -37,6 +101,19 @@ class Step:
         timeout_seconds: Optional timeout in seconds.
     """
 
+    __slots__ = (
+        "fn",
+        "name",
+        "retry",
+        "timeout_seconds",
+        "__name__",
+        "__qualname__",
+        "__wrapped__",
+        "__weakref__",
+    )
+    __doc__ = _FunctionDoc(__doc__)
+    __module__ = _FunctionModule(__module__)
+
     def __init__(
         self,
         fn: Callable[..., Awaitable[Any]],
@@ -45,7 +122,7 @@ class Step:
         retry: RetryConfig = NO_RETRY,
         timeout_seconds: float | None = None,
     ) -> None:
-        if not inspect.iscoroutinefunction(fn):
+        if not is_coro(fn):
             raise TypeError(
                 f"@step requires an async function, got {type(fn).__name__}. "
                 f"Hint: add 'async' before 'def {fn.__name__}'."
@@ -54,7 +131,12 @@ class Step:
         self.name = name or fn.__name__
         self.retry = retry
         self.timeout_seconds = timeout_seconds
-        functools.update_wrapper(self, fn)
+        # The subset of functools.update_wrapper that steps need; there is no
+        # instance __dict__ to copy into, and __doc__/__module__ come from the
+        # _FunctionDoc/_FunctionModule descriptors.
+        self.__name__ = fn.__name__
+        self.__qualname__ = getattr(fn, "__qualname__", fn.__name__)
+        self.__wrapped__ = fn
 
     async def __call__(self, *args: Any, **kwargs: Any) -> Any:
         """Direct call — behaves exactly like the original function.
@@ -71,19 +153,38 @@ class Step:
             StepError: If all retry attempts are exhausted.
             TsunagiTimeoutError: If the step exceeds its timeout.
         """
-        last_error: Exception | None = None
+        return await self._execute(self.fn, *args, **kwargs)
 
+    async def _execute(
+        self, call: Callable[..., Awaitable[Any]], /, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run `call` under this step's retry and timeout policy."""
         timeout_seconds = self.timeout_seconds
+        retry = self.retry
+        max_attempts = retry.max_attempts
+
+        # Fast path for the default step (single attempt, no timeout): no loop,
+        # no retry bookkeeping. Checked per call since retry/timeout are mutable.
+        if max_attempts == 1 and timeout_seconds is None:
+            try:
+                return await call(*args, **kwargs)
+            except TimeoutError:
+                # Same as the general loop: without a step timeout, the step's
+                # own TimeoutError propagates unwrapped.
+                raise
+            except Exception as e:
+                raise StepError(self.name, e, 1) from e
+
+        last_error: Exception | None = None
 
-        for attempt in range(self.retry.max_attempts):
+        for attempt in range(max_attempts):
             try:
                 if timeout_seconds is not None:
-                    result = await asyncio.wait_for(
-                        self.fn(*args, **kwargs),
-                        timeout=timeout_seconds,
-                    )
+                    # Deadline on the current task; unlike wait_for, no wrapper Task.
+                    async with asyncio.timeout(timeout_seconds):
+                        result = await call(*args, **kwargs)
                 else:
-                    result = await self.fn(*args, **kwargs)
+                    result = await call(*args, **kwargs)
                 return result
 
             except TimeoutError:
@@ -93,25 +194,25 @@ class Step:
 
             except Exception as e:
                 last_error = e
-                is_last_attempt = attempt >= self.retry.max_attempts - 1
+                has_next_attempt = attempt < max_attempts - 1
 
-                if is_last_attempt or not self.retry.should_retry(e):
+                if not has_next_attempt or not retry.should_retry(e):
                     raise StepError(self.name, e, attempt + 1) from e
 
-                delay = self.retry.get_delay(attempt)
-                await asyncio.sleep(delay)
+                # Only reached when another attempt follows: the final failure
+                # never pays for a backoff delay (or its jitter computation).
+                delay = retry.get_delay(attempt)
+                await asyncio.sleep(delay if delay >= _MIN_SLEEP_SECONDS else 0)
 
         # Should not reach here, but just in case
-        raise StepError(
-            self.name, last_error or RuntimeError("Unknown error"), self.retry.max_attempts
-        )
+        raise StepError(self.name, last_error or RuntimeError("Unknown error"), max_attempts)
 
-    def __rshift__(self, other: Step) -> StepSequence:
+    def __rshift__(self, other: Step | StepSequence) -> StepSequence:
         """Compose steps: step_a >> step_b creates a sequence."""
         if isinstance(other, StepSequence):
-            return StepSequence([self] + other.steps)
+            return StepSequence((self, *other.steps))
         if isinstance(other, Step):
-            return StepSequence([self, other])
+            return StepSequence((self, other))
         return NotImplemented
 
     def bind(self, **kwargs: Any) -> BoundStep:
@@ -131,33 +232,28 @@ class Step:
 class BoundStep(Step):
     """A step with pre-bound keyword arguments."""
 
+    __slots__ = ("_original", "_bound_kwargs", "_call")
+
     def __init__(self, original: Step, bound_kwargs: dict[str, Any]) -> None:
         # Don't call super().__init__ — we delegate to the original
         self._original = original
         self._bound_kwargs = bound_kwargs
+        # Call-time kwargs override bound ones; binding a BoundStep again
+        # layers onto its partial instead of dropping the earlier kwargs.
+        base = original._call if isinstance(original, BoundStep) else original.fn
+        self._call: Callable[..., Awaitable[Any]] = functools.partial(base, **bound_kwargs)
         self.fn = original.fn
         self.name = original.name
         self.retry = original.retry
         self.timeout_seconds = original.timeout_seconds
 
     async def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        merged = {**self._bound_kwargs, **kwargs}
-        return await self._original.fn(*args, **merged)
+        return await self._call(*args, **kwargs)
 
     async def execute(self, *args: Any, **kwargs: Any) -> Any:
-        merged = {**self._bound_kwargs, **kwargs}
-
-        # Temporarily swap fn to include bound kwargs
-        original_fn = self._original.fn
-
-        async def bound_fn(*a: Any, **kw: Any) -> Any:
-            return await original_fn(*a, **{**merged, **kw})
-
-        self._original.fn = bound_fn  # type: ignore[assignment]
-        try:
-            return await self._original.execute(*args)
-        finally:
-            self._original.fn = original_fn
+        # The original step is never mutated, so bound copies of the same step
+        # can run concurrently.
+        return await self._original._execute(self._call, *args, **kwargs)
 
 
 class StepSequence:
@@ -166,14 +262,17 @@ class StepSequence:
     Used internally by Pipeline.run() to determine execution order.
     """
 
-    def __init__(self, steps: list[Step]) -> None:
-        self.steps = steps
+    __slots__ = ("steps",)
+
+    def __init__(self, steps: Iterable[Step]) -> None:
+        # A tuple: immutable, and >> builds the next sequence without an extra list.
+        self.steps: tuple[Step, ...] = tuple(steps)
 
     def __rshift__(self, other: Step | StepSequence) -> StepSequence:
         if isinstance(other, StepSequence):
             return StepSequence(self.steps + other.steps)
         if isinstance(other, Step):
-            return StepSequence(self.steps + [other])
+            return StepSequence((*self.steps, other))
         return NotImplemented
 
     def __repr__(self) -> str:
@@ -1,104 +1,238 @@
 """The @tool decorator for Agent tool registration.
 
-Tools are async functions that an Agent's LLM can invoke via tool_use.
+Tools are functions that an Agent's LLM can invoke via tool_use.
+Async functions are awaited directly; plain functions run in a worker
+thread so blocking work never stalls the event loop.
 The decorator extracts the function's name, docstring, and type hints
 to auto-generate the tool schema sent to the LLM.
 """
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
 import inspect
-from typing import TYPE_CHECKING, Any, get_type_hints
+import types
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin, get_type_hints
+
+from tsunagi._utils import is_coro
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Callable, Mapping
+
+
+_TYPE_MAP: dict[Any, str] = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
 
 
 class Tool:
-    """An agent-callable tool backed by an async function.
+    """An agent-callable tool backed by a sync or async function.
 
     Attributes:
-        fn: The original async function.
+        fn: The original function.
         name: Tool name (from function name).
         description: Tool description (from docstring).
-        parameters: JSON Schema-compatible parameter definitions.
+        parameters: JSON Schema-compatible parameter definitions, as a read-only
+                    mapping (nested mappings are read-only too, "required" is a tuple).
     """
 
-    def __init__(self, fn: Callable[..., Awaitable[Any]]) -> None:
-        if not inspect.iscoroutinefunction(fn):
-            raise TypeError(
-                f"@tool requires an async function, got {type(fn).__name__}. "
-                f"Hint: add 'async' before 'def {fn.__name__}'."
-            )
+    __slots__ = ("fn", "name", "description", "parameters", "_is_async", "_schema")
+
+    def __init__(self, fn: Callable[..., Any]) -> None:
         self.fn = fn
+        self._is_async = is_coro(fn)
         self.name = fn.__name__
         self.description = (fn.__doc__ or "").strip()
-        self.parameters = self._extract_parameters(fn)
-
-    @staticmethod
-    def _extract_parameters(fn: Callable[..., Any]) -> dict[str, Any]:
-        """Extract JSON Schema-compatible parameters from type hints."""
-
-        hints = get_type_hints(fn)
-        sig = inspect.signature(fn)
-        properties: dict[str, Any] = {}
-        required: list[str] = []
-
-        type_map: dict[type, str] = {
-            str: "string",
-            int: "integer",
-            float: "number",
-            bool: "boolean",
-            list: "array",
-            dict: "object",
-        }
-
-        for param_name, param in sig.parameters.items():
-            if param_name in ("self", "cls"):
-                continue
-
-            hint = hints.get(param_name, Any)
-            json_type = type_map.get(hint, "string")
-            properties[param_name] = {"type": json_type}
-
-            if param.default is inspect.Parameter.empty:
-                required.append(param_name)
-
-        return {
-            "type": "object",
-            "properties": properties,
-            "required": required,
+        self.parameters = _extract_parameters(fn)
+        # Plain dicts and lists for the SDKs, which JSON-encode the schema.
+        self._schema: dict[str, Any] = {
+            "name": self.name,
+            "description": self.description,
+            "input_schema": _thaw(self.parameters),
         }
 
     async def __call__(self, **kwargs: Any) -> Any:
-        """Invoke the tool with keyword arguments."""
+        """Invoke the tool with keyword arguments.
+
+        Sync functions are offloaded with asyncio.to_thread; an awaitable they
+        return (e.g. a plain def wrapping a coroutine function) is awaited.
+        """
 
-        return await self.fn(**kwargs)
+        if self._is_async:
+            return await self.fn(**kwargs)
+        result = await asyncio.to_thread(self.fn, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
 
     def to_schema(self) -> dict[str, Any]:
         """Generate the tool schema for LLM API calls.
 
         Returns a dict compatible with both OpenAI and Anthropic tool formats.
         The caller (Agent) adapts this to the specific API format.
+
+        The schema is built once at construction and the same dict is returned
+        on every call — treat it as read-only.
         """
 
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": self.parameters,
-        }
+        return self._schema
+
+    def to_schema_copy(self) -> dict[str, Any]:
+        """Return a deep copy of the tool schema that is safe to mutate."""
+
+        return copy.deepcopy(self._schema)
 
     def __repr__(self) -> str:
         return f"Tool({self.name})"
 
 
-def tool(fn: Callable[..., Awaitable[Any]]) -> Tool:
-    """Decorator to create an agent tool from an async function.
+def _extract_parameters(fn: Callable[..., Any]) -> Mapping[str, Any]:
+    """Extract JSON Schema-compatible parameters from type hints.
+
+    Memoized per function: get_type_hints() is slow, and the same function is
+    often wrapped by many Tools (tests, hot reload). The key also covers the
+    code, defaults and annotations, so a reloader patching those in place gets
+    a fresh schema. The cache holds strong references to up to 1024
+    functions; unhashable callables or defaults skip it.
+    The result is frozen so sharing it between those Tools is safe.
+    """
+
+    kwdefaults = getattr(fn, "__kwdefaults__", None) or {}
+    annotations = getattr(fn, "__annotations__", None) or {}
+    try:
+        return _cached_parameters(
+            fn,
+            getattr(fn, "__code__", None),
+            getattr(fn, "__defaults__", None),
+            tuple(kwdefaults.items()),
+            tuple(annotations.items()),
+        )
+    except TypeError:
+        return _build_parameters(fn)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_parameters(fn: Callable[..., Any], *state: Any) -> Mapping[str, Any]:
+    return _build_parameters(fn)
+
+
+def _build_parameters(fn: Callable[..., Any]) -> Mapping[str, Any]:
+    hints = get_type_hints(fn)
+    properties: dict[str, Any] = {}
+    required: list[str] = []
+
+    for param_name, is_required in _named_parameters(fn):
+        if param_name in ("self", "cls"):
+            continue
+
+        properties[param_name] = _hint_schema(hints.get(param_name, Any))
+
+        if is_required:
+            required.append(param_name)
+
+    return types.MappingProxyType(
+        {
+            "type": "object",
+            "properties": _freeze(properties),
+            "required": tuple(required),
+        }
+    )
+
+
+def _named_parameters(fn: Callable[..., Any]) -> list[tuple[str, bool]]:
+    """(name, required) for each named parameter of fn; *args / **kwargs are skipped.
+
+    Plain functions are read straight from their code object, which is much
+    cheaper than inspect.signature(). Anything that may present a different
+    signature (bound methods, functools.wraps decorators, partials, callable
+    objects) goes through inspect.signature().
+    """
+
+    code = getattr(fn, "__code__", None)
+    if (
+        code is None
+        or inspect.ismethod(fn)
+        or hasattr(fn, "__wrapped__")
+        or hasattr(fn, "__signature__")
+    ):
+        return [
+            (name, param.default is inspect.Parameter.empty)
+            for name, param in inspect.signature(fn).parameters.items()
+            if param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+        ]
+
+    n_positional = code.co_argcount
+    names = code.co_varnames[: n_positional + code.co_kwonlyargcount]
+    n_required_positional = n_positional - len(fn.__defaults__ or ())
+    kwdefaults = fn.__kwdefaults__ or {}
+    return [
+        (name, i < n_required_positional if i < n_positional else name not in kwdefaults)
+        for i, name in enumerate(names)
+    ]
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+
+    if isinstance(value, dict):
+        return types.MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze: plain dicts and lists, e.g. for JSON encoding."""
+
+    if isinstance(value, types.MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _hint_schema(hint: Any) -> dict[str, Any]:
+    """Map a type hint to a JSON Schema fragment. Unknown types fall back to string."""
+
+    # Plain builtin types are the common case: one dict lookup, no get_origin().
+    json_type = _TYPE_MAP.get(hint)
+    if json_type is not None:
+        return {"type": json_type}
+
+    origin = get_origin(hint)
+    if origin is Union or origin is types.UnionType:
+        # Optional[X] / X | None describe X; requiredness comes from the default.
+        args = [a for a in get_args(hint) if a is not type(None)]
+        return _hint_schema(args[0]) if len(args) == 1 else {"type": "string"}
+    if origin is list:
+        schema: dict[str, Any] = {"type": "array"}
+        item_args = get_args(hint)
+        if item_args:
+            schema["items"] = _hint_schema(item_args[0])
+        return schema
+    if origin is dict:
+        return {"type": "object"}
+    return {"type": "string"}
+
+
+def tool(fn: Callable[..., Any]) -> Tool:
+    """Decorator to create an agent tool from a function.
 
     Usage:
         @tool
         async def web_search(query: str) -> str:
             ...
+
+        @tool
+        def word_count(text: str) -> int:  # runs in a worker thread
+            ...
     """
 
     return Tool(fn)
@@ -6,19 +6,24 @@ Custom tracers implement the Tracer protocol — no base class inheritance requi
 
 from __future__ import annotations
 
+import reprlib
 import sys
-from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from tsunagi.context import Context
 
 
-@runtime_checkable
 class Tracer(Protocol):
     """Protocol for pipeline tracers.
 
     Implement any subset of these methods. All are optional with default no-ops.
     Using Protocol (not ABC) so any object with matching methods works — no inheritance needed.
+
+    Not runtime-checkable: Pipeline and Agent bind the methods a tracer has once,
+    when it is attached, and fill in no-ops for the rest.
     """
 
     async def on_pipeline_start(self, ctx: Context) -> None: ...
@@ -47,6 +52,23 @@ class NullTracer:
         pass
 
 
+class _TracerHooks(NamedTuple):
+    """A tracer's methods, bound once; missing ones are NullTracer no-ops."""
+
+    on_pipeline_start: Callable[[Context], Awaitable[None]]
+    on_pipeline_end: Callable[[Context], Awaitable[None]]
+    on_step_start: Callable[[Context, str, Any], Awaitable[None]]
+    on_step_end: Callable[[Context, str, Any], Awaitable[None]]
+    on_step_error: Callable[[Context, str, Exception], Awaitable[None]]
+
+    @classmethod
+    def bind(cls, tracer: Tracer) -> _TracerHooks:
+        return cls(*(getattr(tracer, name, getattr(_NULL_TRACER, name)) for name in cls._fields))
+
+
+_NULL_TRACER = NullTracer()
+
+
 class StdoutTracer:
     """Simple tracer that prints to stdout. Useful for development.
 
@@ -58,33 +80,42 @@ class StdoutTracer:
     def __init__(self, verbose: bool = False) -> None:
         self.verbose = verbose
 
+    # Each event is one complete line written with a single write() call, so
+    # lines stay whole when steps run concurrently and stderr is unbuffered.
+
     async def on_pipeline_start(self, ctx: Context) -> None:
-        print(f"▶ Pipeline '{ctx.pipeline_name}' started [run={ctx.run_id}]", file=sys.stderr)
+        sys.stderr.write(f"▶ Pipeline '{ctx.pipeline_name}' started [run={ctx.run_id}]\n")
 
     async def on_pipeline_end(self, ctx: Context) -> None:
         summary = ctx.summary()
         status = "✓" if not ctx.failed_steps else "✗"
-        print(
+        sys.stderr.write(
             f"{status} Pipeline '{ctx.pipeline_name}' finished "
-            f"[{summary['total_duration_ms']}ms, {len(ctx.timings)} steps]",
-            file=sys.stderr,
+            f"[{summary['total_duration_ms']}ms, {len(ctx.timings)} steps]\n"
         )
 
     async def on_step_start(self, ctx: Context, step_name: str, input_data: Any) -> None:
-        print(f"  → {step_name}", file=sys.stderr, end="")
-        if self.verbose:
-            print(f" (input: {_truncate(input_data)})", file=sys.stderr, end="")
-        print(file=sys.stderr)
+        detail = f" (input: {_truncate(input_data)})" if self.verbose else ""
+        sys.stderr.write(f"  → {step_name}{detail}\n")
 
     async def on_step_end(self, ctx: Context, step_name: str, result: Any) -> None:
         timing = ctx.timings[-1] if ctx.timings else None
         ms = f" [{timing.duration_ms:.1f}ms]" if timing and timing.duration_ms else ""
-        print(f"  ✓ {step_name}{ms}", file=sys.stderr)
+        sys.stderr.write(f"  ✓ {step_name}{ms}\n")
 
     async def on_step_error(self, ctx: Context, step_name: str, error: Exception) -> None:
-        print(f"  ✗ {step_name} FAILED: {error}", file=sys.stderr)
+        sys.stderr.write(f"  ✗ {step_name} FAILED: {error}\n")
+
+
+# reprlib caps strings and containers while walking them, so tracing a huge
+# prompt or embedding never builds its full repr just to cut it down.
+_REPR = reprlib.Repr()
+_REPR.maxstring = 80
+_REPR.maxother = 80
+_REPR.maxlist = _REPR.maxtuple = _REPR.maxset = _REPR.maxfrozenset = _REPR.maxdeque = 8
+_REPR.maxdict = 4
 
 
 def _truncate(obj: Any, max_len: int = 80) -> str:
-    s = repr(obj)
+    s = _REPR.repr(obj)
     return s[:max_len] + "..." if len(s) > max_len else s
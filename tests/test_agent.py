@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import TYPE_CHECKING, Any
+import sys
+from types import ModuleType, SimpleNamespace
+from typing import Any
 
 import pytest
 
-from tsunagi import Agent, AgentEvent, ToolCall, tool
-
-if TYPE_CHECKING:
-    from tsunagi.agent import Message
+from tsunagi import Agent, AgentEvent, Message, NullTracer, OpenAIAdapter, ToolCall, tool
+from tsunagi.agent import _ApiMessages
 
 
 class TextAdapter:
@@ -115,3 +116,192 @@ async def test_agent_stream() -> None:
     assert json.loads(events[1].result) == 3
     assert events[2] == AgentEvent(type="text", text="done")
     assert events[-1] == AgentEvent(type="done")
+
+
+class MultiToolAdapter:
+    def __init__(self, tool_calls: list[ToolCall]) -> None:
+        self.tool_calls = tool_calls
+        self.calls = 0
+        self.seen_messages: list[list[Message]] = []
+
+    async def send(self, messages, tools):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        self.seen_messages.append(list(messages))
+        if self.calls == 1:
+            return None, self.tool_calls
+        return "done", []
+
+
+@pytest.mark.asyncio
+async def test_agent_runs_tool_calls_concurrently() -> None:
+    running = 0
+    peak = 0
+
+    @tool
+    async def slow(label: str) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return label
+
+    adapter = MultiToolAdapter(
+        [
+            ToolCall(id="a", name="slow", arguments={"label": "first"}),
+            ToolCall(id="b", name="slow", arguments={"label": "second"}),
+        ]
+    )
+    agent = Agent(adapter)
+    agent.register(slow)
+
+    assert await agent.chat("go") == "done"
+    assert peak == 2
+
+    tool_results = [
+        m.content[0]["content"]
+        for m in adapter.seen_messages[-1]
+        if isinstance(m.content, list) and m.content[0]["type"] == "tool_result"
+    ]
+    assert tool_results == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_agent_stream_tool_error() -> None:
+    @tool
+    async def broken() -> str:
+        raise ValueError("boom")
+
+    adapter = ToolThenTextAdapter(ToolCall(id="1", name="broken", arguments={}), "done")
+    agent = Agent(adapter)
+    agent.register(broken)
+
+    events = [event async for event in agent.stream("go")]
+
+    assert [e.type for e in events] == ["tool_call", "error", "tool_result", "text", "done"]
+    assert events[2].result == "Error: boom"
+
+
+@pytest.mark.asyncio
+async def test_agent_traces_unserializable_tool_result_as_error() -> None:
+    @tool
+    async def opaque() -> object:
+        return object()
+
+    class RecordingTracer(NullTracer):
+        def __init__(self) -> None:
+            self.events: list[str] = []
+
+        async def on_step_end(self, ctx, step_name, result):  # type: ignore[no-untyped-def]
+            self.events.append("end")
+
+        async def on_step_error(self, ctx, step_name, error):  # type: ignore[no-untyped-def]
+            self.events.append(type(error).__name__)
+
+    tracer = RecordingTracer()
+    adapter = ToolThenTextAdapter(ToolCall(id="1", name="opaque", arguments={}), "done")
+    agent = Agent(adapter, tracer=tracer)
+    agent.register(opaque)
+
+    assert await agent.chat("go") == "done"
+    assert tracer.events == ["TypeError"]
+
+
+class FakeOpenAIClient:
+    """Minimal stand-in for AsyncOpenAI that records request payloads."""
+
+    def __init__(self) -> None:
+        self.payloads: list[list[dict[str, Any]]] = []
+        self.chat = self
+        self.completions = self
+
+    async def create(self, **kwargs: Any) -> Any:
+        self.payloads.append(list(kwargs["messages"]))
+        message = SimpleNamespace(content="ok", tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.mark.asyncio
+async def test_adapter_converts_appended_messages_incrementally() -> None:
+    adapter = OpenAIAdapter(system="be brief")
+    client = FakeOpenAIClient()
+    adapter._client = client
+
+    history = [Message(role="user", content="hi")]
+    await adapter.send(history, [])
+    history.append(Message(role="assistant", content="hello"))
+    history.append(Message(role="user", content="again"))
+    await adapter.send(history, [])
+    await adapter.send([Message(role="user", content="fresh")], [])
+
+    assert client.payloads[0] == [
+        {"role": "system", "content": "be brief"},
+        {"role": "user", "content": "hi"},
+    ]
+    assert [m["content"] for m in client.payloads[1]] == ["be brief", "hi", "hello", "again"]
+    assert [m["content"] for m in client.payloads[2]] == ["be brief", "fresh"]
+
+
+def test_api_messages_detects_in_place_history_edits() -> None:
+    buffer = _ApiMessages()
+    m1, m2, m3 = (Message(role="user", content=c) for c in ("one", "two", "three"))
+
+    history = [m1, m2]
+    first = buffer.sync(history)
+    history.pop(0)
+    history.append(m3)
+    second = buffer.sync(history)
+    history[-1].content = "edited"
+    third = buffer.sync(history)
+
+    assert [m["content"] for m in first] == ["one", "two"]
+    assert [m["content"] for m in second] == ["two", "three"]
+    assert [m["content"] for m in third] == ["two", "edited"]
+
+
+def test_api_messages_returns_independent_payloads() -> None:
+    buffer = _ApiMessages()
+    history = [Message(role="user", content="hi")]
+
+    first = buffer.sync(history)
+    history.append(Message(role="assistant", content="hello"))
+    second = buffer.sync(history)
+
+    assert len(first) == 1
+    assert len(second) == 2
+
+
+@pytest.mark.asyncio
+async def test_openai_adapter_reads_system_on_every_send() -> None:
+    adapter = OpenAIAdapter(system="be brief")
+    client = FakeOpenAIClient()
+    adapter._client = client
+
+    history = [Message(role="user", content="hi")]
+    await adapter.send(history, [])
+    adapter.system = "be verbose"
+    await adapter.send(history, [])
+    adapter.system = ""
+    await adapter.send(history, [])
+
+    assert [m["content"] for m in client.payloads[0]] == ["be brief", "hi"]
+    assert [m["content"] for m in client.payloads[1]] == ["be verbose", "hi"]
+    assert [m["content"] for m in client.payloads[2]] == ["hi"]
+
+
+@pytest.mark.asyncio
+async def test_adapter_reuses_its_sdk_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    class AsyncOpenAI:
+        def __init__(self, **kwargs: Any) -> None:
+            self.kwargs = kwargs
+
+    fake_openai = ModuleType("openai")
+    fake_openai.AsyncOpenAI = AsyncOpenAI  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "openai", fake_openai)
+
+    adapter = OpenAIAdapter(api_key="k")
+    client = adapter._get_client()
+
+    assert adapter._get_client() is client
+    assert client.kwargs == {"api_key": "k"}
+    assert OpenAIAdapter(api_key="k")._get_client() is not client
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from tsunagi import batched, map_batches
+
+
+def test_batched_splits_evenly_and_remainder() -> None:
+    assert batched([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert batched(iter("abc"), 5) == [["a", "b", "c"]]
+    assert batched([], 3) == []
+
+
+def test_batched_rejects_zero_size() -> None:
+    with pytest.raises(ValueError):
+        batched([1], 0)
+
+
+@pytest.mark.asyncio
+async def test_map_batches_preserves_order() -> None:
+    calls: list[list[int]] = []
+
+    async def square(batch: list[int]) -> list[int]:
+        calls.append(batch)
+        # Later batches finish first to prove ordering is by index, not completion.
+        await asyncio.sleep(0.01 / (len(calls) + 1))
+        return [x * x for x in batch]
+
+    result = await map_batches(square, range(7), batch_size=3)
+
+    assert result == [0, 1, 4, 9, 16, 25, 36]
+    assert [len(c) for c in calls] == [3, 3, 1]
+
+
+@pytest.mark.asyncio
+async def test_map_batches_bounds_concurrency() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def track(batch: list[int]) -> list[int]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return batch
+
+    result = await map_batches(track, range(10), batch_size=1, max_concurrency=2)
+
+    assert result == list(range(10))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_map_batches_length_mismatch() -> None:
+    async def drop_one(batch: list[int]) -> list[int]:
+        return batch[1:]
+
+    with pytest.raises(ValueError):
+        await map_batches(drop_one, [1, 2], batch_size=2)
+
+
+@pytest.mark.asyncio
+async def test_map_batches_rejects_zero_concurrency() -> None:
+    async def echo(batch: list[int]) -> list[int]:
+        return batch
+
+    with pytest.raises(ValueError):
+        await map_batches(echo, [1, 2], batch_size=1, max_concurrency=0)
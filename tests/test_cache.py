@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from tsunagi import SemanticCache, cached, step
+
+
+def test_semantic_cache_hit_on_similar_vector() -> None:
+    cache = SemanticCache(threshold=0.9)
+    cache.put([1.0, 0.0], "east")
+
+    assert cache.get([0.99, 0.05]) == "east"
+    assert cache.get([0.0, 1.0]) is None
+
+
+def test_semantic_cache_picks_most_similar() -> None:
+    cache = SemanticCache(threshold=0.5)
+    cache.put([1.0, 0.0], "east")
+    cache.put([0.7, 0.7], "north-east")
+
+    assert cache.get([0.6, 0.8]) == "north-east"
+
+
+def test_semantic_cache_lru_eviction() -> None:
+    cache = SemanticCache(threshold=0.99, max_entries=2)
+    cache.put([1.0, 0.0], "a")
+    cache.put([0.0, 1.0], "b")
+    assert cache.get([1.0, 0.0]) == "a"  # "a" becomes most recently used
+
+    cache.put([1.0, 1.0], "c")
+
+    assert len(cache) == 2
+    assert cache.get([0.0, 1.0]) is None
+    assert cache.get([1.0, 0.0]) == "a"
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_semantic_cache_rows_stay_consistent_across_evictions(
+    monkeypatch: pytest.MonkeyPatch, use_numpy: bool
+) -> None:
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr("tsunagi.cache._numpy", lambda: None)
+    cache = SemanticCache(threshold=0.99, max_entries=3)
+    axes = [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+
+    cache.put(axes[0], 0)
+    matrix = cache._matrix
+    for i in (1, 2, 3, 0, 1):
+        cache.put(axes[i], i)
+
+    assert cache._matrix is matrix  # rows are written in place, never rebuilt
+    assert len(cache) == 3
+    assert cache.get(axes[2]) is None
+    assert [cache.get(axes[i]) for i in (3, 0, 1)] == [3, 0, 1]
+
+
+def test_semantic_cache_rejects_mismatched_dimensions() -> None:
+    pytest.importorskip("numpy")
+    cache = SemanticCache()
+    cache.put([1.0, 0.0], "east")
+
+    with pytest.raises(ValueError, match="2-dimensional"):
+        cache.put([1.0, 0.0, 0.0], "up")
+    assert len(cache) == 1
+
+
+def test_semantic_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 100.0
+    monkeypatch.setattr("tsunagi.cache.time.monotonic", lambda: now)
+    cache = SemanticCache(ttl_seconds=10)
+    cache.put([1.0], "x")
+
+    assert cache.get([1.0]) == "x"
+    now = 111.0
+    assert cache.get([1.0]) is None
+    assert len(cache) == 0
+
+
+def test_semantic_cache_ignores_zero_vector() -> None:
+    cache = SemanticCache()
+    cache.put([0.0, 0.0], "zero")
+
+    assert len(cache) == 0
+    assert cache.get([0.0, 0.0]) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_memoizes_async_function() -> None:
+    calls: list[str] = []
+
+    @step
+    @cached(max_entries=2)
+    async def embed(text: str) -> int:
+        calls.append(text)
+        return len(text)
+
+    assert embed.name == "embed"
+    assert await embed.execute("hello") == 5
+    assert await embed("hello") == 5
+    assert await embed("hi") == 2
+    assert calls == ["hello", "hi"]
+
+
+@pytest.mark.asyncio
+async def test_cached_does_not_store_failures() -> None:
+    calls = 0
+
+    @cached()
+    async def flaky(x: int) -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError("first call fails")
+        return x
+
+    with pytest.raises(ValueError):
+        await flaky(1)
+    assert await flaky(1) == 1
+    assert calls == 2
+
+
+def test_semantic_cache_pure_python_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("tsunagi.cache._numpy", lambda: None)
+    cache = SemanticCache(threshold=0.9)
+    cache.put([3.0, 4.0], "hit")
+
+    assert cache.get([6.0, 8.0]) == "hit"
+    assert cache.get([4.0, -3.0]) is None
+
+
+def test_semantic_cache_accepts_numpy_arrays() -> None:
+    np = pytest.importorskip("numpy")
+    cache = SemanticCache(threshold=0.9)
+    cache.put(np.array([1.0, 0.0], dtype=np.float32), "east")
+    cache.put(np.array([0.0, 1.0], dtype=np.float32), "north")
+
+    assert cache.get(np.array([0.1, 0.99])) == "north"
+    assert cache.get(np.array([-1.0, 0.0])) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_keeps_keyword_and_positional_calls_apart() -> None:
+    @cached()
+    async def echo(*args: Any, **kwargs: Any) -> tuple[Any, ...]:
+        return (args, kwargs)
+
+    first = await echo(1, 2, k=3)
+    second = await echo((1, 2), (("k", 3),))
+
+    assert first == ((1, 2), {"k": 3})
+    assert second == (((1, 2), (("k", 3),)), {})
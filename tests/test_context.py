@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import time
 
 import pytest
 
-from tsunagi import Context
+from tsunagi import Context, StepTiming
 
 
 def test_context_creation() -> None:
@@ -12,6 +14,8 @@ def test_context_creation() -> None:
     ctx2 = Context(pipeline_name="b")
 
     assert ctx1.run_id != ctx2.run_id
+    assert len(ctx1.run_id) == 12
+    int(ctx1.run_id, 16)
     assert ctx1.metadata == {}
 
 
@@ -37,6 +41,8 @@ def test_context_summary() -> None:
     assert summary["pipeline"] == "pipe"
     assert len(summary["steps"]) == 2
     assert summary["steps"][0]["name"] == "a"
+    assert t1.duration_ms is not None and t2.duration_ms is not None
+    assert ctx.total_duration_ms == pytest.approx(t1.duration_ms + t2.duration_ms)
 
 
 def test_failed_steps() -> None:
@@ -49,3 +55,25 @@ def test_failed_steps() -> None:
     failed = ctx.failed_steps
     assert len(failed) == 1
     assert failed[0].step_name == "bad"
+
+
+def test_context_asdict_has_no_cycle() -> None:
+    ctx = Context(pipeline_name="pipe")
+    ctx.start_step("a").finish()
+
+    data = dataclasses.asdict(ctx)
+    assert data["timings"][0]["step_name"] == "a"
+    assert "_context" not in data["timings"][0]
+
+
+def test_total_duration_includes_hand_added_timings() -> None:
+    ctx = Context(pipeline_name="pipe")
+    ctx.start_step("tracked").finish()
+    manual = StepTiming(step_name="manual", started_at=time.perf_counter_ns() - 5_000_000)
+    ctx.timings.append(manual)
+    manual.finish()
+
+    assert manual.duration_ms is not None and manual.duration_ms >= 5
+    assert ctx.total_duration_ms == pytest.approx(
+        sum(t.duration_ms for t in ctx.timings if t.duration_ms is not None)
+    )
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tsunagi import Context
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+
+def _load(name: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, EXAMPLES / f"{name}.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_calculator_evaluates_arithmetic() -> None:
+    calc = _load("agent_with_tools")
+
+    assert calc._evaluate(calc._parse("2 ** 10 + sqrt(16)")) == 1028
+    assert calc._evaluate(calc._parse("(2 ** 10) ** 100")) == 2**1000
+
+
+@pytest.mark.parametrize(
+    "expression", ["9 ** 9 ** 9", "(9 ** 999) ** 999", "((9 ** 999) ** 999) ** 999"]
+)
+def test_calculator_rejects_oversized_powers(expression: str) -> None:
+    calc = _load("agent_with_tools")
+
+    with pytest.raises(ValueError, match="too large"):
+        calc._evaluate(calc._parse(expression))
+
+
+def test_calculator_bounds_long_multiplication_chains() -> None:
+    calc = _load("agent_with_tools")
+
+    with pytest.raises(ValueError, match="too large"):
+        calc._evaluate(calc._parse("*".join(["9 ** 3000"] * 400)))
+
+
+@pytest.mark.asyncio
+async def test_sentence_chunks_carry_sentences_across_pages() -> None:
+    rag = _load("japanese_rag")
+    pages = ["一文目。 二文", "目の続き。 三", "", "文目", "。 四文目？"]
+
+    assert await rag.sentence_chunks(pages) == [
+        "一文目。",
+        "二文\n目の続き。",
+        "三\n\n文目\n。",
+        "四文目？",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_embed_chunks_handles_empty_input() -> None:
+    pytest.importorskip("numpy")
+    rag = _load("japanese_rag")
+
+    fp32 = await rag.embed_chunks([], client=None)
+    codes, scales = await rag.embed_chunks([], client=None, mode="int8")
+    bits = await rag.embed_chunks([], client=None, mode="binary")
+
+    assert fp32.shape == (0, rag.EMBED_DIM)
+    assert codes.shape == (0, rag.EMBED_DIM) and scales.shape == (0,)
+    assert bits.shape == (0, rag.EMBED_DIM // 8)
+
+
+@pytest.mark.asyncio
+async def test_jsonl_tracer_flushes_without_pipeline_end(tmp_path: Path) -> None:
+    tracer_module = _load("custom_tracer")
+    path = tmp_path / "trace.jsonl"
+    tracer = tracer_module.JSONLTracer(path, max_buffered=3, flush_interval=0.01)
+    ctx = Context(pipeline_name="agent")
+
+    await tracer.on_step_start(ctx, "tool", {"q": 1})
+    await asyncio.sleep(0.05)
+    assert len(path.read_bytes().splitlines()) == 1  # time threshold
+
+    for _ in range(3):
+        await tracer.on_step_end(ctx, "tool", "ok")
+    assert len(path.read_bytes().splitlines()) == 4  # size threshold
+
+    await tracer.close()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from tests.conftest import add_one, always_fail, double, to_string
-from tsunagi import NullTracer, Pipeline, PipelineError
+from tsunagi import NullTracer, Pipeline, PipelineError, step
 
 
 class MockTracer:
@@ -105,6 +107,55 @@ async def test_pipeline_parallel() -> None:
     assert results == [6, 10]
 
 
+@pytest.mark.asyncio
+async def test_pipeline_parallel_max_concurrency() -> None:
+    running = 0
+    peak = 0
+
+    @step
+    async def tracked(x: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return x
+
+    pipe = Pipeline("bounded")
+    results = await pipe.run_parallel(
+        [tracked] * 6, inputs=list(range(6)), max_concurrency=2, jitter=0.001
+    )
+
+    assert results == list(range(6))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_parallel_as_completed() -> None:
+    @step
+    async def sleepy(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    pipe = Pipeline("streamed")
+    seen = [
+        pair
+        async for pair in pipe.run_parallel_as_completed(
+            [sleepy, sleepy, sleepy], inputs=[0.03, 0.0, 0.015]
+        )
+    ]
+
+    assert seen == [(1, 0.0), (2, 0.015), (0, 0.03)]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_parallel_as_completed_error() -> None:
+    pipe = Pipeline("streamed_err")
+    with pytest.raises(PipelineError):
+        async for _ in pipe.run_parallel_as_completed([add_one, always_fail], input=1):
+            pass
+
+
 @pytest.mark.asyncio
 async def test_pipeline_no_tracer_overhead() -> None:
     pipe = Pipeline("no_tracer")
@@ -114,3 +165,56 @@ async def test_pipeline_no_tracer_overhead() -> None:
     result_null = await pipe_with_null.run(add_one, input=1)
 
     assert result_default == result_null == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_null_tracer_subclass_still_traced() -> None:
+    class CountingTracer(NullTracer):
+        def __init__(self) -> None:
+            self.steps: list[str] = []
+
+        async def on_step_end(self, ctx, step_name, result):  # type: ignore[no-untyped-def]
+            self.steps.append(step_name)
+
+    tracer = CountingTracer()
+    pipe = Pipeline("subclass").use(tracer)
+    await pipe.run(add_one >> double, input=1)
+
+    assert tracer.steps == ["add_one", "double"]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_partial_tracer() -> None:
+    class EndOnlyTracer:
+        def __init__(self) -> None:
+            self.steps: list[str] = []
+
+        async def on_step_end(self, ctx, step_name, result):  # type: ignore[no-untyped-def]
+            self.steps.append(step_name)
+
+    tracer = EndOnlyTracer()
+    pipe = Pipeline("partial").use(tracer)
+    assert await pipe.run(add_one >> double, input=1) == 4
+
+    assert tracer.steps == ["add_one", "double"]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_chain() -> None:
+    flow = Pipeline.chain(add_one, double >> add_one, to_string)
+
+    assert flow.steps == (add_one, double, add_one, to_string)
+    assert await Pipeline("chain").run(flow, input=1) == "5"
+
+    with pytest.raises(TypeError):
+        Pipeline.chain(add_one, "double")
+
+
+@pytest.mark.asyncio
+async def test_pipeline_parallel_rejects_zero_concurrency() -> None:
+    pipe = Pipeline("zero")
+    with pytest.raises(ValueError):
+        await pipe.run_parallel([add_one], input=1, max_concurrency=0)
+    with pytest.raises(ValueError):
+        async for _ in pipe.run_parallel_as_completed([add_one], input=1, max_concurrency=0):
+            pass
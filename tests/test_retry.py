@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from tests import conftest
-from tests.conftest import fail_twice_then_succeed
-from tsunagi import NO_RETRY, RetryConfig
+from tests.conftest import always_fail, fail_twice_then_succeed
+from tsunagi import NO_RETRY, RetryConfig, StepError, step
 
 
 def test_no_retry_default() -> None:
@@ -28,6 +30,15 @@ def test_retry_on_filter() -> None:
     assert cfg.should_retry(ValueError()) is True
     assert cfg.should_retry(TypeError()) is False
 
+    by_type = RetryConfig(retry_on_types=(ValueError, ConnectionError))
+    assert by_type.should_retry(ConnectionResetError()) is True
+    assert by_type.should_retry(TypeError()) is False
+
+    combined = RetryConfig(retry_on_types=(ValueError,), retry_on=lambda e: "busy" in str(e))
+    assert combined.should_retry(ValueError()) is True
+    assert combined.should_retry(RuntimeError("server busy")) is True
+    assert combined.should_retry(RuntimeError("bad request")) is False
+
 
 @pytest.mark.asyncio
 async def test_step_retry_execution() -> None:
@@ -35,3 +46,93 @@ async def test_step_retry_execution() -> None:
     result = await fail_twice_then_succeed.execute(1)
     assert result == 101
     assert conftest.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_no_sleep_after_final_attempt(monkeypatch: pytest.MonkeyPatch) -> None:
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    with pytest.raises(StepError):
+        await always_fail.execute(1)
+    assert delays == []
+
+    @step(retry=RetryConfig(max_attempts=3, delay_seconds=1, jitter=False))
+    async def flaky(x: int) -> int:
+        raise ValueError("nope")
+
+    with pytest.raises(StepError) as exc:
+        await flaky.bind().execute(1)
+    assert exc.value.attempts == 3
+    assert delays == [1, 2]
+
+
+def test_retry_delay_schedule_precomputed() -> None:
+    kwargs = {"max_attempts": 4, "delay_seconds": 1, "backoff_factor": 3, "max_delay_seconds": 5}
+    cfg = RetryConfig(**kwargs)
+
+    assert cfg._base_delays == (1, 3, 5)
+    assert RetryConfig(**kwargs) == cfg
+    assert "_base_delays" not in repr(cfg)
+
+
+def test_retry_delay_huge_attempt_is_capped() -> None:
+    cfg = RetryConfig(max_attempts=2000, delay_seconds=1, max_delay_seconds=30, jitter=False)
+
+    assert cfg.get_delay(1500) == 30
+    assert cfg.get_delay(5000) == 30
+
+
+def test_zero_delay_skips_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail_random() -> float:
+        raise AssertionError("jitter should not be drawn for a zero delay")
+
+    monkeypatch.setattr("random.random", fail_random)
+    cfg = RetryConfig(max_attempts=3, delay_seconds=0, jitter=True)
+
+    assert cfg.get_delay(0) == 0.0
+    assert cfg.get_delay(1) == 0.0
+
+
+def test_retry_delay_schedule_fills_cap() -> None:
+    cfg = RetryConfig(max_attempts=500, delay_seconds=0.1, backoff_factor=1.5, max_delay_seconds=7)
+
+    assert cfg._base_delays == tuple(cfg._capped_delay(i) for i in range(499))
+    assert cfg._base_delays[-1] == 7
+
+
+def test_jitter_modes() -> None:
+    half = RetryConfig(max_attempts=2, delay_seconds=4)
+    full = RetryConfig(max_attempts=2, delay_seconds=4, jitter_mode="full")
+    none = RetryConfig(max_attempts=2, delay_seconds=4, jitter_mode="none")
+    disabled = RetryConfig(max_attempts=2, delay_seconds=4, jitter=False, jitter_mode="full")
+
+    assert all(2 <= half.get_delay(0) <= 4 for _ in range(100))
+    assert all(0 <= full.get_delay(0) <= 4 for _ in range(100))
+    assert none.get_delay(0) == 4
+    assert disabled.get_delay(0) == 4
+
+    with pytest.raises(ValueError):
+        RetryConfig(jitter_mode="quarter")
+
+
+@pytest.mark.asyncio
+async def test_sub_millisecond_delay_yields_without_timer(monkeypatch: pytest.MonkeyPatch) -> None:
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    @step(retry=RetryConfig(max_attempts=3, delay_seconds=0.0004, backoff_factor=10, jitter=False))
+    async def flaky(x: int) -> int:
+        raise ValueError("boom")
+
+    with pytest.raises(StepError):
+        await flaky.execute(1)
+    assert delays == [0, 0.004]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+from tsunagi import install_fast_loop
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class FakePolicy(asyncio.DefaultEventLoopPolicy):
+    pass
+
+
+def test_install_fast_loop_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    monkeypatch.setitem(sys.modules, "winloop", None)
+
+    assert install_fast_loop() is False
+
+
+def test_install_fast_loop_sets_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = ModuleType("fakeloop")
+    fake.EventLoopPolicy = FakePolicy  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "uvloop", fake)
+    monkeypatch.setitem(sys.modules, "winloop", fake)
+
+    try:
+        assert install_fast_loop() is True
+        assert isinstance(asyncio.get_event_loop_policy(), FakePolicy)
+    finally:
+        asyncio.set_event_loop_policy(None)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from tests.conftest import add_one, always_fail, double, to_string
-from tsunagi import StepError, StepSequence, step
+from tsunagi import RetryConfig, Step, StepError, StepSequence, step
+from tsunagi.errors import TimeoutError as TsunagiTimeoutError
+from tsunagi.step import _min_sleep_seconds
 
 
 @pytest.mark.asyncio
@@ -13,6 +17,40 @@ async def test_step_direct_call() -> None:
 
 def test_step_preserves_function_name() -> None:
     assert add_one.name == "add_one"
+    assert add_one.__name__ == "add_one"
+    assert add_one.__wrapped__ is add_one.fn
+
+
+def test_step_preserves_docstring() -> None:
+    @step
+    async def documented(x: int) -> int:
+        """Doubles nothing."""
+        return x
+
+    assert documented.__doc__ == "Doubles nothing."
+    assert documented.__qualname__.endswith("documented")
+    assert Step.__doc__ is not None
+    assert Step.__doc__.startswith("A composable async function")
+
+
+def test_step_preserves_module() -> None:
+    @step
+    async def local(x: int) -> int:
+        return x
+
+    assert local.__module__ == __name__
+    assert Step.__module__ == "tsunagi.step"
+    assert repr(Step) == "<class 'tsunagi.step.Step'>"
+
+
+def test_step_instances_are_slotted() -> None:
+    @step
+    async def slotted(x: int) -> int:
+        return x
+
+    assert not hasattr(slotted, "__dict__")
+    assert not hasattr(slotted.bind(y=1), "__dict__")
+    assert not hasattr(slotted >> slotted, "__dict__")
 
 
 def test_step_custom_name() -> None:
@@ -47,6 +85,51 @@ async def test_step_execute_failure() -> None:
     assert err.attempts == 1
 
 
+@pytest.mark.asyncio
+async def test_step_retry_reassigned_after_creation() -> None:
+    calls = 0
+
+    @step
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 2:
+            raise ValueError("first call fails")
+        return "ok"
+
+    flaky.retry = RetryConfig(max_attempts=2, delay_seconds=0)
+    assert await flaky.execute() == "ok"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_step_timeout() -> None:
+    @step(timeout_seconds=0.01)
+    async def slow(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    assert await slow.execute(0) == 0
+    with pytest.raises(TsunagiTimeoutError) as exc:
+        await slow.execute(1)
+    assert exc.value.timeout_seconds == 0.01
+    # The expired deadline must not leave the caller's task marked as cancelling.
+    task = asyncio.current_task()
+    assert task is not None
+    assert task.cancelling() == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_attempts", [1, 2])
+async def test_step_own_timeout_error_propagates_unwrapped(max_attempts: int) -> None:
+    @step(retry=RetryConfig(max_attempts=max_attempts, delay_seconds=0))
+    async def upstream_timeout() -> None:
+        raise TimeoutError("upstream")
+
+    with pytest.raises(TimeoutError, match="upstream"):
+        await upstream_timeout.execute()
+
+
 def test_step_composition() -> None:
     seq = add_one >> double
     assert isinstance(seq, StepSequence)
@@ -54,7 +137,8 @@ def test_step_composition() -> None:
 
     seq2 = add_one >> double >> to_string
     assert isinstance(seq2, StepSequence)
-    assert len(seq2.steps) == 3
+    assert seq2.steps == (add_one, double, to_string)
+    assert (add_one >> (double >> to_string)).steps == seq2.steps
 
 
 @pytest.mark.asyncio
@@ -65,3 +149,42 @@ async def test_step_bind() -> None:
 
     bound = compute.bind(y=10, z=5)
     assert await bound.execute(1) == 16
+
+
+@pytest.mark.asyncio
+async def test_bound_copies_run_concurrently() -> None:
+    @step
+    async def tagged(x: int, tag: str) -> str:
+        await asyncio.sleep(0.01)
+        return f"{tag}:{x}"
+
+    first = tagged.bind(tag="a")
+    second = tagged.bind(tag="b")
+
+    results = await asyncio.gather(*(b.execute(i) for i in range(3) for b in (first, second)))
+
+    assert results == ["a:0", "b:0", "a:1", "b:1", "a:2", "b:2"]
+    assert tagged.fn is first.fn
+
+
+@pytest.mark.asyncio
+async def test_rebinding_keeps_earlier_kwargs() -> None:
+    @step
+    async def compute(x: int, y: int, z: int = 0) -> int:
+        return x + y + z
+
+    bound = compute.bind(y=10).bind(z=5)
+    assert await bound.execute(1) == 16
+    assert await bound(1, z=0) == 11
+
+
+@pytest.mark.parametrize("raw", ["fast", "-1", "nan"])
+def test_invalid_min_sleep_env_falls_back(monkeypatch: pytest.MonkeyPatch, raw: str) -> None:
+    monkeypatch.setenv("TSUNAGI_MIN_SLEEP_SECONDS", raw)
+    with pytest.warns(RuntimeWarning):
+        assert _min_sleep_seconds() == 0.001
+
+
+def test_min_sleep_env_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TSUNAGI_MIN_SLEEP_SECONDS", "0")
+    assert _min_sleep_seconds() == 0
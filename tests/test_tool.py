@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import functools
+import json
+import threading
+from typing import Any, Optional
+
 import pytest
 
 from tsunagi import Tool, tool
@@ -23,11 +28,74 @@ def test_tool_parameter_extraction() -> None:
         return f"{query}:{limit}"
 
     schema = search.parameters
-    assert schema["required"] == ["query"]
+    assert schema["required"] == ("query",)
     assert schema["properties"]["query"]["type"] == "string"
     assert schema["properties"]["limit"]["type"] == "integer"
 
 
+def test_tool_parameter_kinds() -> None:
+    def plain(a: int, /, b: str, c: float = 1.0, *args: int, d: bool, e: int = 2, **kw: int) -> str:
+        return ""
+
+    @functools.wraps(plain)
+    def decorated(*args: Any, **kwargs: Any) -> str:
+        return plain(*args, **kwargs)
+
+    for fn in (plain, decorated):
+        params = Tool(fn).parameters
+        assert list(params["properties"]) == ["a", "b", "c", "d", "e"]
+        assert params["required"] == ("a", "b", "d")
+        assert params["properties"]["d"] == {"type": "boolean"}
+
+
+def test_tool_from_bound_method_drops_bound_argument() -> None:
+    class Searcher:
+        def search(this, query: str, limit: int = 5) -> str:  # noqa: N805
+            return query
+
+    params = Tool(Searcher().search).parameters
+    assert list(params["properties"]) == ["query", "limit"]
+    assert params["required"] == ("query",)
+
+
+def test_tool_parameters_are_read_only() -> None:
+    @tool
+    async def search(query: str) -> str:
+        return query
+
+    with pytest.raises(TypeError):
+        search.parameters["required"] = ()  # type: ignore[index]
+    with pytest.raises(TypeError):
+        search.parameters["properties"]["query"]["type"] = "integer"
+
+    input_schema = search.to_schema()["input_schema"]
+    assert json.loads(json.dumps(input_schema)) == {
+        "type": "object",
+        "properties": {"query": {"type": "string"}},
+        "required": ["query"],
+    }
+
+
+def test_tool_parameter_generic_and_optional_hints() -> None:
+    @tool
+    async def lookup(
+        ids: list[int],
+        filters: dict[str, str],
+        tags: list[str] | None = None,
+        ratio: Optional[float] = None,  # noqa: UP045
+        key: int | str = 0,
+    ) -> str:
+        return ""
+
+    props = lookup.parameters["properties"]
+    assert props["ids"] == {"type": "array", "items": {"type": "integer"}}
+    assert props["filters"] == {"type": "object"}
+    assert props["tags"] == {"type": "array", "items": {"type": "string"}}
+    assert props["ratio"] == {"type": "number"}
+    assert props["key"] == {"type": "string"}
+    assert lookup.parameters["required"] == ("ids", "filters")
+
+
 def test_tool_schema_generation() -> None:
     @tool
     async def sample() -> str:
@@ -39,6 +107,21 @@ def test_tool_schema_generation() -> None:
     assert schema["name"] == "sample"
     assert schema["description"] == "Another sample."
     assert "input_schema" in schema
+    assert sample.to_schema() is schema
+
+
+def test_tool_schema_copy_is_independent() -> None:
+    @tool
+    async def search(query: str) -> str:
+        return query
+
+    schema = search.to_schema_copy()
+    schema["input_schema"]["properties"]["query"]["type"] = "integer"
+    schema["input_schema"]["required"].clear()
+
+    assert schema is not search.to_schema()
+    assert search.to_schema()["input_schema"]["properties"]["query"]["type"] == "string"
+    assert search.parameters["required"] == ("query",)
 
 
 @pytest.mark.asyncio
@@ -50,9 +133,49 @@ async def test_tool_invocation() -> None:
     assert await echo(query="hi") == "HI"
 
 
-def test_tool_requires_async() -> None:
-    def sync_tool() -> str:
-        return "nope"
+@pytest.mark.asyncio
+async def test_sync_tool_runs_in_worker_thread() -> None:
+    caller_thread = threading.get_ident()
 
-    with pytest.raises(TypeError):
-        tool(sync_tool)
+    @tool
+    def which_thread(tag: str) -> str:
+        return f"{tag}:{threading.get_ident() != caller_thread}"
+
+    assert which_thread.parameters["required"] == ("tag",)
+    assert await which_thread(tag="t") == "t:True"
+
+
+@pytest.mark.asyncio
+async def test_sync_tool_returning_coroutine_is_awaited() -> None:
+    async def fetch(key: str) -> str:
+        return key.upper()
+
+    def lookup(key: str) -> Any:
+        return fetch(key)
+
+    assert await Tool(lookup)(key="k") == "K"
+
+
+def test_tool_parameters_memoized_per_function() -> None:
+    async def lookup(key: str) -> str:
+        return key
+
+    assert Tool(lookup).parameters is Tool(lookup).parameters
+
+
+def test_tool_parameters_follow_in_place_reload() -> None:
+    async def lookup(key: str) -> str:
+        return key
+
+    async def reloaded(key: str, limit: int = 10) -> str:
+        return key
+
+    before = Tool(lookup).parameters
+    lookup.__code__ = reloaded.__code__
+    lookup.__defaults__ = reloaded.__defaults__
+    lookup.__annotations__ = reloaded.__annotations__
+
+    after = Tool(lookup).parameters
+    assert list(before["properties"]) == ["key"]
+    assert list(after["properties"]) == ["key", "limit"]
+    assert after["required"] == ("key",)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from tsunagi import Context, NullTracer, StdoutTracer
+from tsunagi.tracer import _truncate
 
 
 @pytest.mark.asyncio
@@ -31,3 +34,23 @@ async def test_stdout_tracer_output(capsys) -> None:  # type: ignore[no-untyped-
     captured = capsys.readouterr().err
     assert "Pipeline 'trace' started" in captured
     assert "step1" in captured
+
+
+def test_truncate_is_bounded_for_large_inputs() -> None:
+    assert _truncate({"a": 1}) == "{'a': 1}"
+    assert len(_truncate("x" * 1_000_000)) <= 83
+    assert _truncate(list(range(1_000_000))).endswith("...]")
+    assert len(_truncate([[0.1] * 1536] * 100)) <= 83
+
+
+@pytest.mark.asyncio
+async def test_stdout_tracer_writes_one_line_per_event(monkeypatch: pytest.MonkeyPatch) -> None:
+    writes: list[str] = []
+    monkeypatch.setattr(sys.stderr, "write", writes.append)
+    tracer = StdoutTracer(verbose=True)
+    ctx = Context(pipeline_name="trace")
+
+    await tracer.on_step_start(ctx, "step1", {"a": 1})
+    await tracer.on_step_error(ctx, "step1", ValueError("boom"))
+
+    assert writes == ["  → step1 (input: {'a': 1})\n", "  ✗ step1 FAILED: boom\n"]
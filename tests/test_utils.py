@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from tsunagi._utils import is_coro
+
+
+def test_is_coro_matches_inspect() -> None:
+    async def coro() -> None:
+        pass
+
+    def plain() -> None:
+        pass
+
+    assert is_coro(coro) is True
+    assert is_coro(coro) is True
+    assert is_coro(plain) is False
+
+
+def test_is_coro_unhashable_callable() -> None:
+    class Unhashable:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self) -> None:
+            pass
+
+    assert is_coro(Unhashable()) is False
+
+
+def test_is_coro_sees_code_swapped_in_place() -> None:
+    def reloaded() -> None:
+        return None
+
+    async def replacement() -> None:
+        return None
+
+    assert is_coro(reloaded) is False
+    reloaded.__code__ = replacement.__code__
+    assert is_coro(reloaded) is True